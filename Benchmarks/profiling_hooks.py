@@ -0,0 +1,206 @@
+"""
+Opt-in timers and counters for the GoogleScripts modules.
+
+Instrumented modules import the hooks through one shared shim, so they run unchanged
+(and uninstrumented) when Benchmarks/ is not on the path:
+
+    try:
+        from profiling_hooks import count, profiled
+    except ImportError:
+        # No-op fallbacks when Benchmarks/ is not on the path; see the profiling_hooks docstring
+        def profiled(name=None):
+            return lambda function: function
+
+        def count(name, amount=1):
+            pass
+
+Even when importable, nothing is recorded until profiling is enabled with the
+GOOGLESCRIPTS_PROFILE environment variable or enable().
+"""
+
+import os
+import time
+import threading
+import functools
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+# Profiling is opt-in: off unless this variable is set or enable() is called
+ENABLED_VARIABLE = "GOOGLESCRIPTS_PROFILE"
+MAX_SAMPLES = 100_000  # Timings kept per name; later calls still update the totals
+
+Hook = Callable[[str, str, float], None]
+
+
+class _State:
+    """Process-wide profiling switch, timings, counters and hooks."""
+
+    def __init__(self):
+        self.enabled = bool(os.environ.get(ENABLED_VARIABLE))
+        self.lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {}
+        self.totals: Counter = Counter()
+        self.calls: Counter = Counter()
+        self.counters: Counter = Counter()
+        self.hooks: List[Hook] = []
+
+
+_state = _State()
+
+
+def enable() -> None:
+    """Turns the profiling hooks on for the whole process."""
+    _state.enabled = True
+
+
+def disable() -> None:
+    """Turns the profiling hooks off; instrumented functions then cost one flag check."""
+    _state.enabled = False
+
+
+def is_enabled() -> bool:
+    """True if the profiling hooks currently record."""
+    return _state.enabled
+
+
+def reset() -> None:
+    """Forgets every recorded timing and counter (the hooks stay registered)."""
+    with _state.lock:
+        _state.samples.clear()
+        _state.totals.clear()
+        _state.calls.clear()
+        _state.counters.clear()
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Registers a function called with (kind, name, value) for every emitted measurement,
+    where kind is "timer" (value in seconds) or "counter" (value is the increment).
+
+    :param hook: The function to call, e.g. to forward measurements to a metrics system.
+    """
+    _state.hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """
+    Unregisters a hook added with add_hook.
+
+    :param hook: The function to remove.
+    """
+    _state.hooks.remove(hook)
+
+
+def emit_timing(name: str, seconds: float) -> None:
+    """
+    Records one timing, if profiling is enabled.
+
+    :param name: Name of the timed operation.
+    :param seconds: Duration of the operation.
+    """
+    if not _state.enabled:
+        return
+    with _state.lock:
+        samples = _state.samples.setdefault(name, [])
+        if len(samples) < MAX_SAMPLES:
+            samples.append(seconds)
+        _state.totals[name] += seconds
+        _state.calls[name] += 1
+    for hook in _state.hooks:
+        hook("timer", name, seconds)
+
+
+def count(name: str, amount: float = 1) -> None:
+    """
+    Increments a counter, if profiling is enabled.
+
+    :param name: Name of the counter, e.g. "anonymize_log.redactions".
+    :param amount: Increment.
+    """
+    if not _state.enabled:
+        return
+    with _state.lock:
+        _state.counters[name] += amount
+    for hook in _state.hooks:
+        hook("counter", name, amount)
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """
+    Times the enclosed block under a name, if profiling is enabled.
+
+    :param name: Name of the timed operation.
+    """
+    if not _state.enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit_timing(name, time.perf_counter() - start)
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorator timing every call of a function, if profiling is enabled.
+
+    :param name: Name to record the timings under (defaults to the function's qualified name).
+    :return: The decorator.
+    """
+    def decorate(function: Callable) -> Callable:
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                emit_timing(label, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorate
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Linearly interpolated percentile of already sorted values.
+
+    :param sorted_values: The values, in ascending order.
+    :param fraction: The percentile as a fraction, e.g. 0.99.
+    :return: The percentile (0.0 for no values).
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Summarizes everything recorded since the last reset.
+
+    :return: {"timers": {name: {"calls", "total_s", "mean_ms", "p50_ms", "p95_ms", "max_ms"}},
+              "counters": {name: value}}
+    """
+    with _state.lock:
+        timers = {}
+        for name, samples in _state.samples.items():
+            ordered = sorted(samples)
+            timers[name] = {
+                "calls": _state.calls[name],
+                "total_s": _state.totals[name],
+                "mean_ms": _state.totals[name] / _state.calls[name] * 1e3,
+                "p50_ms": percentile(ordered, 0.50) * 1e3,
+                "p95_ms": percentile(ordered, 0.95) * 1e3,
+                "max_ms": ordered[-1] * 1e3,
+            }
+        return {"timers": timers, "counters": dict(_state.counters)}
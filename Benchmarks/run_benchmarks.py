@@ -0,0 +1,424 @@
+"""
+Benchmark suite for the GoogleScripts modules.
+
+Every case builds its input with synthetic_data (scaled by --scale), runs the function under
+test several times and records throughput, latency percentiles and peak Python memory into
+a JSON results file. Given a baseline results file, cases whose throughput dropped or whose
+peak memory grew by more than the tolerance are reported as regressions (exit status 1).
+
+    python Benchmarks/run_benchmarks.py --scale small --output results.json
+    python Benchmarks/run_benchmarks.py --baseline baseline.json --update-baseline
+    python Benchmarks/run_benchmarks.py --filter anonymize --profile
+
+Cases whose module cannot be imported (e.g. a missing optional dependency) are skipped.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import random
+import argparse
+import platform
+import tempfile
+import importlib
+import importlib.util
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+REPOSITORY_ROOT = os.path.dirname(BENCHMARKS_DIRECTORY)
+MODULE_DIRECTORIES = ["Flag_Logs", "PEP_8", "Portfolio Activity", "Regular_expressions", "OS"]
+# The scripts import their siblings directly, and pick up profiling_hooks from here
+for directory in [BENCHMARKS_DIRECTORY] + [os.path.join(REPOSITORY_ROOT, name) for name in MODULE_DIRECTORIES]:
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+import profiling_hooks  # noqa: E402
+import synthetic_data  # noqa: E402
+from profiling_hooks import percentile  # noqa: E402
+
+SCALES = {"small": 1, "medium": 10, "large": 100}
+DEFAULT_TOLERANCE = 0.15
+ALLOW_LIST_SCRIPT = os.path.join(REPOSITORY_ROOT, "Portfolio Activity", "Update a file through a Python algorithm.py")
+
+
+class Workload(NamedTuple):
+    """A prepared benchmark: `run` is timed, `prepare` (untimed) restores its input before each run."""
+    run: Callable[[], Any]
+    items: int
+    unit: str
+    prepare: Optional[Callable[[], None]] = None
+
+
+Setup = Callable[[int, str], Workload]
+CASES: Dict[str, Tuple[int, Setup]] = {}
+
+
+def case(name: str, base_size: int) -> Callable[[Setup], Setup]:
+    """
+    Registers a benchmark case.
+
+    :param name: Name of the case in the results.
+    :param base_size: Input size at the "small" scale, multiplied by the scale factor.
+    :return: Decorator for the setup function, called with (size, working directory).
+    """
+    def register(setup: Setup) -> Setup:
+        CASES[name] = (base_size, setup)
+        return setup
+    return register
+
+
+def _load_allow_list_module():
+    """Imports the allow list script, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location("update_allow_list_script", ALLOW_LIST_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_dictionary(brute_force, workdir: str) -> None:
+    """Loads the synthetic words as the brute-force dictionary, without touching the user's cache."""
+    word_path = synthetic_data.write_lines(os.path.join(workdir, "words.txt"), list(synthetic_data.WORDS))
+    previous = os.environ.get(brute_force.DICTIONARY_PATH_VARIABLE)
+    os.environ[brute_force.DICTIONARY_PATH_VARIABLE] = word_path
+    try:
+        brute_force.get_dictionary(cache_path=os.path.join(workdir, "words.pickle"))
+    finally:
+        # The dictionary stays loaded for the process; the caller's environment is left as it was
+        if previous is None:
+            del os.environ[brute_force.DICTIONARY_PATH_VARIABLE]
+        else:
+            os.environ[brute_force.DICTIONARY_PATH_VARIABLE] = previous
+
+
+@case("count_failed_attempts", 100_000)
+def _count_failed_attempts(size: int, workdir: str) -> Workload:
+    attempts = importlib.import_module("logIn_attempts")
+    usernames = synthetic_data.make_usernames(size)
+    return Workload(lambda: attempts.count_failed_attempts(usernames, "user000"), size, "attempts")
+
+
+@case("build_attempts_table", 100_000)
+def _build_attempts_table(size: int, workdir: str) -> Workload:
+    attempts = importlib.import_module("logIn_attempts")
+    path = synthetic_data.write_lines(os.path.join(workdir, "failed.log"), synthetic_data.make_usernames(size))
+    return Workload(lambda: attempts.build_attempts_table(path), size, "lines")
+
+
+@case("anonymize_log", 20_000)
+def _anonymize_log(size: int, workdir: str) -> Workload:
+    parsing = importlib.import_module("parsing_logs_files")
+    path = synthetic_data.write_lines(os.path.join(workdir, "app.log"), synthetic_data.make_app_log(size))
+    output = os.path.join(workdir, "anonymized.log")
+    return Workload(lambda: parsing.anonymize_log(path, output, ["user001", "user002"],
+                                                  rules=parsing.DEFAULT_REDACTION_RULES), size, "lines")
+
+
+@case("detect_suspicious_activity", 20_000)
+def _detect_suspicious_activity(size: int, workdir: str) -> Workload:
+    parsing = importlib.import_module("parsing_logs_files")
+    path = synthetic_data.write_lines(os.path.join(workdir, "app.log"), synthetic_data.make_app_log(size))
+    return Workload(lambda: parsing.detect_suspicious_activity(path, synthetic_data.SUSPICIOUS_KEYWORDS),
+                    size, "lines")
+
+
+@case("generate_hash", 4)
+def _generate_hash(size: int, workdir: str) -> Workload:
+    tools = importlib.import_module("PEP8_demotration")
+    path = os.path.join(workdir, "data.bin")
+    with open(path, "wb") as file:
+        file.write(random.Random(0).randbytes(size * 1024 * 1024))
+    return Workload(lambda: tools.generate_hash(path), size * 1024 * 1024, "bytes")
+
+
+@case("hash_tree", 40)
+def _hash_tree(size: int, workdir: str) -> Workload:
+    tools = importlib.import_module("PEP8_demotration")
+    root = synthetic_data.make_file_tree(os.path.join(workdir, "tree"), size)
+    return Workload(lambda: tools.hash_tree(root), size, "files")
+
+
+@case("scan_ports", 200)
+def _scan_ports(size: int, workdir: str) -> Workload:
+    tools = importlib.import_module("PEP8_demotration")
+    ports = list(range(40000, 40000 + size))
+    return Workload(lambda: tools.scan_ports("127.0.0.1", ports), size, "ports")
+
+
+@case("scan_ports_concurrent", 200)
+def _scan_ports_concurrent(size: int, workdir: str) -> Workload:
+    tools = importlib.import_module("PEP8_demotration")
+    ports = list(range(40000, 40000 + size))
+    return Workload(lambda: tools.scan_ports_concurrent("127.0.0.1", ports), size, "ports")
+
+
+@case("generate_passwords", 10_000)
+def _generate_passwords(size: int, workdir: str) -> Workload:
+    tools = importlib.import_module("PEP8_demotration")
+    return Workload(lambda: tools.generate_passwords(size), size, "passwords")
+
+
+@case("update_allow_list", 20_000)
+def _update_allow_list(size: int, workdir: str) -> Workload:
+    allow_list = _load_allow_list_module()
+    allow, remove = synthetic_data.make_allow_list(size)
+    original = synthetic_data.write_lines(os.path.join(workdir, "allow_list.original"), allow)
+    remove_path = synthetic_data.write_lines(os.path.join(workdir, "remove_list.txt"), remove)
+    target = os.path.join(workdir, "allow_list.txt")
+    return Workload(lambda: allow_list.update_allow_list(target, remove_path), size, "entries",
+                    prepare=lambda: shutil.copyfile(original, target))
+
+
+@case("brute_force_attack", 20)
+def _brute_force_attack(size: int, workdir: str) -> Workload:
+    brute_force = importlib.import_module("BruteForce")
+    _load_dictionary(brute_force, workdir)
+    ciphertext, _ = synthetic_data.make_ciphertext(size)
+    return Workload(lambda: brute_force.brute_force_attack(ciphertext), 1, "ciphertexts")
+
+
+@case("fast_brute_force_attack", 20)
+def _fast_brute_force_attack(size: int, workdir: str) -> Workload:
+    brute_force = importlib.import_module("BruteForce")
+    _load_dictionary(brute_force, workdir)
+    ciphertext, _ = synthetic_data.make_ciphertext(size)
+    return Workload(lambda: brute_force.fast_brute_force_attack(ciphertext), 1, "ciphertexts")
+
+
+@case("frequency_attack", 200)
+def _frequency_attack(size: int, workdir: str) -> Workload:
+    brute_force = importlib.import_module("BruteForce")
+    _load_dictionary(brute_force, workdir)
+    ciphertext, _ = synthetic_data.make_ciphertext(size, key_size=5)
+    return Workload(lambda: brute_force.frequency_attack(ciphertext), len(ciphertext), "bytes")
+
+
+@case("iter_indicators", 20_000)
+def _iter_indicators(size: int, workdir: str) -> Workload:
+    regular_expression = importlib.import_module("regular_expression")
+    path = synthetic_data.write_lines(os.path.join(workdir, "app.log"), synthetic_data.make_app_log(size))
+
+    def run() -> int:
+        with open(path, "r") as file:
+            return sum(1 for _ in regular_expression.iter_indicators(file))
+
+    return Workload(run, size, "lines")
+
+
+@case("aggregate_addresses", 20_000)
+def _aggregate_addresses(size: int, workdir: str) -> Workload:
+    ip_extraction = importlib.import_module("ip_extraction")
+    lines = synthetic_data.make_app_log(size)
+    return Workload(lambda: ip_extraction.aggregate_addresses(lines), size, "lines")
+
+
+@case("system_info_to_json", 10_000)
+def _system_info_to_json(size: int, workdir: str) -> Workload:
+    os_version = importlib.import_module("os_version")
+    snapshot = os_version.SystemInfoSnapshot()
+
+    def run() -> None:
+        for _ in range(size):
+            snapshot.to_json()
+
+    return Workload(run, size, "calls")
+
+
+def run_case(name: str, size: int, setup: Setup, repeat: int = 5, warmup: int = 1,
+             memory: bool = True, profile: bool = False) -> Dict[str, Any]:
+    """
+    Runs one benchmark case in a scratch directory.
+
+    :param name: Name of the case.
+    :param size: Input size handed to the setup function.
+    :param setup: Function building the workload.
+    :param repeat: Number of timed runs.
+    :param warmup: Number of untimed runs first (caches, imports, dictionary loading).
+    :param memory: Measure peak Python memory with an extra, tracemalloc-traced run.
+    :param profile: Record the profiling hooks emitted during the timed runs.
+    :return: The measurements of the case.
+    """
+    with tempfile.TemporaryDirectory() as workdir, redirect_stdout(io.StringIO()):
+        workload = setup(size, workdir)
+        for _ in range(warmup):
+            if workload.prepare:
+                workload.prepare()
+            workload.run()
+
+        if profile:
+            profiling_hooks.reset()
+            profiling_hooks.enable()
+        latencies = []
+        try:
+            for _ in range(repeat):
+                if workload.prepare:
+                    workload.prepare()
+                start = time.perf_counter()
+                workload.run()
+                latencies.append(time.perf_counter() - start)
+        finally:
+            if profile:
+                profiling_hooks.disable()
+
+        peak = None
+        if memory:
+            if workload.prepare:
+                workload.prepare()
+            tracemalloc.start()
+            try:
+                workload.run()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+    ordered = sorted(latencies)
+    median = percentile(ordered, 0.50)
+    result = {
+        "case": name,
+        "size": size,
+        "items": workload.items,
+        "unit": workload.unit,
+        "repeat": repeat,
+        "throughput": workload.items / median if median > 0 else float("inf"),
+        "latency_ms": {
+            "min": ordered[0] * 1e3,
+            "p50": median * 1e3,
+            "p90": percentile(ordered, 0.90) * 1e3,
+            "p99": percentile(ordered, 0.99) * 1e3,
+            "max": ordered[-1] * 1e3,
+            "mean": sum(ordered) / len(ordered) * 1e3,
+        },
+        "peak_memory_bytes": peak,
+    }
+    if profile:
+        result["profile"] = profiling_hooks.snapshot()
+    return result
+
+
+def run_benchmarks(scale: str = "small", repeat: int = 5, warmup: int = 1, selected: Optional[List[str]] = None,
+                   memory: bool = True, profile: bool = False,
+                   report: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Runs the registered cases and collects their results.
+
+    :param scale: One of SCALES, multiplying every case's base size.
+    :param repeat: Number of timed runs per case.
+    :param warmup: Number of untimed runs per case.
+    :param selected: Substrings selecting the cases to run (all cases when empty).
+    :param memory: Measure peak Python memory.
+    :param profile: Record the profiling hooks during the timed runs.
+    :param report: Function called with (case name, result or {"skipped": reason}) as cases finish.
+    :return: {"meta": {...}, "results": {case: result}, "skipped": {case: reason}}.
+    """
+    results, skipped = {}, {}
+    for name, (base_size, setup) in CASES.items():
+        if selected and not any(part in name for part in selected):
+            continue
+        try:
+            results[name] = run_case(name, base_size * SCALES[scale], setup, repeat, warmup, memory, profile)
+        except ImportError as error:
+            skipped[name] = f"{type(error).__name__}: {error}"
+        if report:
+            report(name, results.get(name) or {"skipped": skipped[name]})
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": scale,
+            "repeat": repeat,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    tolerance: float = DEFAULT_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    Finds the cases that got slower or hungrier than in a baseline run of the same scale.
+
+    :param current: Results of run_benchmarks.
+    :param baseline: Earlier results of run_benchmarks.
+    :param tolerance: Relative change tolerated before flagging, e.g. 0.15 for 15%.
+    :return: List of {"case", "metric", "baseline", "current", "change"} regressions.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None or previous["size"] != result["size"]:
+            continue  # New case, or measured at another scale
+        throughput_change = result["throughput"] / previous["throughput"] - 1 if previous["throughput"] else 0.0
+        if throughput_change < -tolerance:
+            regressions.append({"case": name, "metric": "throughput", "baseline": previous["throughput"],
+                                "current": result["throughput"], "change": throughput_change})
+        if result["peak_memory_bytes"] and previous["peak_memory_bytes"]:
+            memory_change = result["peak_memory_bytes"] / previous["peak_memory_bytes"] - 1
+            if memory_change > tolerance:
+                regressions.append({"case": name, "metric": "peak_memory_bytes",
+                                    "baseline": previous["peak_memory_bytes"],
+                                    "current": result["peak_memory_bytes"], "change": memory_change})
+    return regressions
+
+
+def _print_result(name: str, result: Dict[str, Any]) -> None:
+    if "skipped" in result:
+        print(f"{name:<28} skipped ({result['skipped']})")
+        return
+    peak = result["peak_memory_bytes"]
+    memory = f"{peak / 1024 / 1024:8.2f} MiB" if peak is not None else "       -    "
+    print(f"{name:<28} {result['throughput']:>14,.0f} {result['unit']}/s   "
+          f"p50 {result['latency_ms']['p50']:9.2f} ms   p99 {result['latency_ms']['p99']:9.2f} ms   peak {memory}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns 1 when regressions against the baseline were found."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", choices=SCALES, default="small", help="input size multiplier")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per case")
+    parser.add_argument("--filter", nargs="*", default=[], help="run only cases containing one of these strings")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results file to write")
+    parser.add_argument("--baseline", help="JSON results file to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to --baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="relative change flagged")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory run")
+    parser.add_argument("--profile", action="store_true", help="record the profiling hooks of the hot functions")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    arguments = parser.parse_args(argv)
+
+    if arguments.list:
+        for name, (base_size, _) in CASES.items():
+            print(f"{name:<28} base size {base_size:,}")
+        return 0
+
+    results = run_benchmarks(arguments.scale, arguments.repeat, arguments.warmup, arguments.filter,
+                             not arguments.no_memory, arguments.profile, report=_print_result)
+    with open(arguments.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {arguments.output}")
+
+    status = 0
+    if arguments.baseline and os.path.exists(arguments.baseline) and not arguments.update_baseline:
+        with open(arguments.baseline, "r") as file:
+            regressions = compare_results(results, json.load(file), arguments.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression['case']}: {regression['metric']} {regression['change']:+.1%} "
+                  f"({regression['baseline']:,.0f} -> {regression['current']:,.0f})")
+        if not regressions:
+            print(f"No regressions against {arguments.baseline} (tolerance {arguments.tolerance:.0%}).")
+        status = 1 if regressions else 0
+    if arguments.baseline and arguments.update_baseline:
+        with open(arguments.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Baseline written to {arguments.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+import os
+import random
+from typing import List, Tuple
+
+# Words used for log messages and plaintexts; every one is also written to the word list
+# used as the brute-force dictionary, so generated plaintexts are recognized as English
+WORDS = (
+    "the quick brown fox jumps over lazy dog access granted denied user login session "
+    "server request network packet firewall alert system update file report secure key"
+).split()
+SUSPICIOUS_KEYWORDS = ["unauthorized", "malware", "breach"]
+USERS = [f"user{number:03}" for number in range(200)]
+
+
+def _random_ip(generator: random.Random) -> str:
+    return ".".join(str(generator.randrange(1, 255)) for _ in range(4))
+
+
+def write_lines(file_path: str, lines: List[str]) -> str:
+    """
+    Writes lines to a file, one per line.
+
+    :param file_path: Path of the file to create.
+    :param lines: The lines, without newlines.
+    :return: The file path.
+    """
+    with open(file_path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+    return file_path
+
+
+def make_usernames(count: int, users: int = 50, seed: int = 0) -> List[str]:
+    """
+    Generates a failed-login log as read by read_log_file: one username per attempt,
+    with a skewed distribution so a few users fail far more often than the rest.
+
+    :param count: Number of attempts.
+    :param users: Number of distinct users.
+    :param seed: Random seed.
+    :return: The usernames.
+    """
+    generator = random.Random(seed)
+    population = USERS[:users]
+    weights = [1 / (rank + 1) for rank in range(len(population))]
+    return generator.choices(population, weights, k=count)
+
+
+def make_app_log(count: int, seed: int = 0) -> List[str]:
+    """
+    Generates application log lines mixing IPs, emails, card numbers and, on about
+    one line in twenty, a suspicious keyword.
+
+    :param count: Number of lines.
+    :param seed: Random seed.
+    :return: The log lines.
+    """
+    generator = random.Random(seed)
+    lines = []
+    for number in range(count):
+        user = generator.choice(USERS)
+        parts = [f"2024-01-01 12:{number // 60 % 60:02}:{number % 60:02}", generator.choice(["INFO", "WARN", "ERROR"]),
+                 f"user={user}", f"ip={_random_ip(generator)}", " ".join(generator.choices(WORDS, k=6))]
+        kind = generator.randrange(20)
+        if kind == 0:
+            parts.append(generator.choice(SUSPICIOUS_KEYWORDS))
+        elif kind < 4:
+            parts.append(f"contact={user}@example.com")
+        elif kind < 6:
+            parts.append("card=" + "-".join(f"{generator.randrange(10000):04}" for _ in range(4)))
+        lines.append(" ".join(parts))
+    return lines
+
+
+def make_allow_list(count: int, remove_ratio: float = 0.1, seed: int = 0) -> Tuple[List[str], List[str]]:
+    """
+    Generates an allow list and a remove list drawn partly from it, plus a few CIDR blocks.
+
+    :param count: Number of allow list entries.
+    :param remove_ratio: Share of the allow list to remove.
+    :param seed: Random seed.
+    :return: (allow list entries, remove list entries).
+    """
+    generator = random.Random(seed)
+    allow = [_random_ip(generator) for _ in range(count)]
+    remove = generator.sample(allow, int(count * remove_ratio))
+    remove.extend(f"{generator.randrange(1, 224)}.0.0.0/8" for _ in range(3))
+    return allow, remove
+
+
+def make_plaintext(words: int, seed: int = 0) -> str:
+    """
+    Generates an English-like plaintext made of WORDS.
+
+    :param words: Number of words.
+    :param seed: Random seed.
+    :return: The plaintext.
+    """
+    return " ".join(random.Random(seed).choices(WORDS, k=words))
+
+
+def make_ciphertext(words: int, key_size: int = 2, seed: int = 0) -> Tuple[bytes, bytes]:
+    """
+    Encrypts a generated plaintext with a random repeating XOR key, as simple_cryptography does.
+
+    :param words: Number of plaintext words.
+    :param key_size: Key length in bytes (2 for the 16-bit cipher).
+    :param seed: Random seed.
+    :return: (ciphertext, key).
+    """
+    generator = random.Random(seed)
+    key = bytes(generator.randrange(256) for _ in range(key_size))
+    plaintext = make_plaintext(words, seed).encode()
+    return bytes(byte ^ key[index % key_size] for index, byte in enumerate(plaintext)), key
+
+
+def make_file_tree(root: str, files: int, file_size: int = 64 * 1024, depth: int = 3, seed: int = 0) -> str:
+    """
+    Creates a directory tree of random files, spread over nested directories.
+
+    :param root: Directory to create the tree in.
+    :param files: Number of files.
+    :param file_size: Size of each file in bytes.
+    :param depth: Nesting depth of the directories.
+    :param seed: Random seed.
+    :return: The root directory.
+    """
+    generator = random.Random(seed)
+    for number in range(files):
+        directory = os.path.join(root, *(f"dir{generator.randrange(4)}" for _ in range(depth)))
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"file{number}.bin"), "wb") as file:
+            file.write(generator.randbytes(file_size))
+    return root
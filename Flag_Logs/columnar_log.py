@@ -0,0 +1,227 @@
+import socket
+import struct
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # NumPy is optional: columns fall back to array.array and plain loops
+
+MISSING = -1
+
+
+def parse_ipv4(value: str) -> Optional[int]:
+    """
+    Packs a dotted-quad IPv4 address into an unsigned 32-bit integer.
+
+    Only the strict dotted-quad form is accepted, as by inet_pton: octal, hex and
+    shortened forms such as "010.0.0.1" are rejected rather than reinterpreted.
+
+    :param value: The IPv4 address string.
+    :return: The packed address, or None if the value is not a valid IPv4 address.
+    """
+    try:
+        return struct.unpack("!I", socket.inet_pton(socket.AF_INET, value))[0]
+    except OSError:
+        return None
+
+
+def ip_to_int(value: str) -> int:
+    """
+    Packs a dotted-quad IPv4 address into an unsigned 32-bit integer.
+
+    :param value: The IPv4 address string.
+    :return: The packed address, or 0 if the value is not a valid IPv4 address.
+    """
+    packed = parse_ipv4(value)
+    return 0 if packed is None else packed
+
+
+class ColumnarLog:
+    """
+    Compact, column-oriented form of a whitespace-split log.
+
+    Every distinct word is interned once in a vocabulary; the log itself is a single
+    array of word ids plus an array of line offsets, instead of one Python list of
+    strings per line. Field columns (the n-th word of every line) are built on demand,
+    as NumPy arrays when NumPy is installed, and conversions such as IP packing or
+    timestamp parsing run once per distinct value rather than once per line.
+    """
+
+    def __init__(self):
+        self.vocabulary: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self.tokens = array("I")
+        self.offsets = array("Q", [0])
+        self._columns: Dict[int, object] = {}
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "ColumnarLog":
+        """
+        Builds the columnar log from lines of text.
+
+        :param lines: Iterable of log lines.
+        :return: The columnar log.
+        """
+        log = cls()
+        ids, vocabulary, tokens, offsets = log._ids, log.vocabulary, log.tokens, log.offsets
+        for line in lines:
+            for word in line.split():
+                word_id = ids.get(word)
+                if word_id is None:
+                    word_id = ids[word] = len(vocabulary)
+                    vocabulary.append(word)
+                tokens.append(word_id)
+            offsets.append(len(tokens))
+        return log
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "ColumnarLog":
+        """
+        Builds the columnar log by streaming a file.
+
+        :param file_path: Path to the log file.
+        :return: The columnar log.
+        """
+        with open(file_path, "r") as file:
+            return cls.from_lines(file)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> List[str]:
+        """Returns one line as a list of words, like secure_parse_log."""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("Row index out of range.")
+        vocabulary = self.vocabulary
+        return [vocabulary[word_id] for word_id in self.tokens[self.offsets[row]:self.offsets[row + 1]]]
+
+    def __iter__(self) -> Iterator[List[str]]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def to_lists(self) -> List[List[str]]:
+        """Expands back into the list-of-lists form returned by secure_parse_log."""
+        return list(self)
+
+    def nbytes(self) -> int:
+        """Approximate memory used by the token and offset arrays (excluding the vocabulary)."""
+        return self.tokens.itemsize * len(self.tokens) + self.offsets.itemsize * len(self.offsets)
+
+    def field_ids(self, position: int):
+        """
+        Returns the word id at a field position for every line (MISSING if the line is shorter).
+
+        :param position: Zero-based index of the word within each line.
+        :return: NumPy int64 array, or array('q') without NumPy.
+        """
+        column = self._columns.get(position)
+        if column is not None:
+            return column
+
+        if np is not None:
+            tokens = np.frombuffer(self.tokens, dtype=np.uint32) if len(self.tokens) else np.zeros(0, np.uint32)
+            offsets = np.frombuffer(self.offsets, dtype=np.uint64).astype(np.int64)
+            indices = offsets[:-1] + position
+            present = indices < offsets[1:]
+            column = np.full(len(self), MISSING, dtype=np.int64)
+            column[present] = tokens[indices[present]]
+        else:
+            tokens, offsets = self.tokens, self.offsets
+            column = array("q", (
+                tokens[offsets[row] + position] if offsets[row] + position < offsets[row + 1] else MISSING
+                for row in range(len(self))
+            ))
+        self._columns[position] = column
+        return column
+
+    def field_values(self, position: int) -> List[Optional[str]]:
+        """
+        Returns the word at a field position for every line.
+
+        :param position: Zero-based index of the word within each line.
+        :return: List of words (None where the line is shorter).
+        """
+        vocabulary = self.vocabulary
+        return [vocabulary[word_id] if word_id != MISSING else None for word_id in self.field_ids(position)]
+
+    def converted_column(self, position: int, converter: Callable[[str], float], default: float = 0):
+        """
+        Converts a field column to numbers, calling the converter once per distinct word.
+
+        :param position: Zero-based index of the word within each line.
+        :param converter: Function turning a word into a number (e.g. ip_to_int, a timestamp parser).
+        :param default: Value for missing fields and words the converter rejects with ValueError.
+        :return: NumPy float64 array, or array('d') without NumPy.
+        """
+        def convert(word: str) -> float:
+            try:
+                return converter(word)
+            except ValueError:
+                return default
+
+        field_ids = self.field_ids(position)
+        if np is not None:
+            used = np.unique(field_ids[field_ids != MISSING]).tolist()
+        else:
+            used = set(field_ids) - {MISSING}
+        lookup = {word_id: convert(self.vocabulary[word_id]) for word_id in used}
+        if np is not None:
+            table = np.full(len(self.vocabulary) + 1, default, dtype=np.float64)
+            for word_id, value in lookup.items():
+                table[word_id] = value
+            # MISSING (-1) indexes the trailing default slot
+            return table[field_ids]
+        return array("d", (lookup.get(word_id, default) for word_id in field_ids))
+
+    def ip_column(self, position: int):
+        """
+        Packs an IPv4 field column into unsigned 32-bit integers (0 where invalid or missing).
+
+        :param position: Zero-based index of the IP address within each line.
+        :return: NumPy uint32 array, or array('I') without NumPy.
+        """
+        packed = self.converted_column(position, ip_to_int)
+        if np is not None:
+            return packed.astype(np.uint32)
+        return array("I", (int(value) for value in packed))
+
+    def filter(self, position: int, value: str) -> List[int]:
+        """
+        Finds the lines whose field at `position` equals `value`.
+
+        :param position: Zero-based index of the word within each line.
+        :param value: The word to look for.
+        :return: List of matching row indices.
+        """
+        word_id = self._ids.get(value)
+        if word_id is None:
+            return []
+        field_ids = self.field_ids(position)
+        if np is not None:
+            return np.flatnonzero(field_ids == word_id).tolist()
+        return [row for row, field_id in enumerate(field_ids) if field_id == word_id]
+
+    def group_count(self, position: int) -> Dict[str, int]:
+        """
+        Counts the lines per distinct value of a field.
+
+        :param position: Zero-based index of the word within each line.
+        :return: Dictionary of word -> number of lines, most frequent first.
+        """
+        field_ids = self.field_ids(position)
+        if np is not None:
+            present = field_ids[field_ids != MISSING]
+            counts = np.bincount(present, minlength=0) if len(present) else np.zeros(0, np.int64)
+            pairs = [(self.vocabulary[word_id], int(counts[word_id])) for word_id in np.flatnonzero(counts)]
+        else:
+            totals: Dict[int, int] = {}
+            for field_id in field_ids:
+                if field_id != MISSING:
+                    totals[field_id] = totals.get(field_id, 0) + 1
+            pairs = [(self.vocabulary[word_id], count) for word_id, count in totals.items()]
+        pairs.sort(key=lambda pair: pair[1], reverse=True)
+        return dict(pairs)
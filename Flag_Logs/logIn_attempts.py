@@ -1,4 +1,19 @@
-from typing import List
+from collections import Counter, OrderedDict, deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+try:
+    from profiling_hooks import count, profiled
+except ImportError:
+    # No-op fallbacks when Benchmarks/ is not on the path; see the profiling_hooks docstring
+    def profiled(name=None):
+        return lambda function: function
+
+    def count(name, amount=1):
+        pass
+
+LOCKOUT_THRESHOLD = 3
+LOCKOUT_WINDOW = 300.0  # Seconds
 
 def read_log_file(file_path: str) -> List[str]:
     """
@@ -14,34 +29,238 @@ def read_log_file(file_path: str) -> List[str]:
         print("Error: The log file was not found.")
         return []
 
-def count_failed_attempts(login_list: List[str], current_user: str) -> int:
+def iter_log_file(file_path: str) -> Iterator[str]:
+    """
+    Lazily yields the usernames of a failed-login log file, one line at a time.
+    
+    :param file_path: Path to the log file.
+    :return: Iterator over the usernames in the log file.
+    """
+    try:
+        with open(file_path, 'r') as file:
+            for line in file:
+                yield line.strip()
+    except FileNotFoundError:
+        print("Error: The log file was not found.")
+
+def build_attempts_table(file_path: str) -> Counter:
+    """
+    Streams a log file once and counts the failed login attempts of every user.
+    
+    Memory is bounded by the number of distinct users, not by the size of the file.
+    
+    :param file_path: Path to the log file.
+    :return: Counter mapping each username to its number of failed attempts.
+    """
+    return Counter(username for username in iter_log_file(file_path) if username)
+
+@profiled()
+def count_failed_attempts(login_list: Union[List[str], Mapping[str, int]], current_user: str) -> int:
     """
     Counts the number of failed login attempts for a specific user.
     
-    :param login_list: List of usernames representing failed login attempts.
+    :param login_list: List of usernames representing failed login attempts,
+                       or a table built by build_attempts_table (O(1) lookup).
     :param current_user: The username to check.
     :return: The count of failed login attempts for the user.
     """
+    if isinstance(login_list, Mapping):
+        return login_list.get(current_user, 0)
+    
     counter = 0
     for username in login_list:
         if username == current_user:
             counter += 1
     return counter
 
-def login_check(login_list: List[str], current_user: str) -> None:
+def login_check(login_list: Union[List[str], Mapping[str, int]], current_user: str) -> None:
     """
     Checks if a user has had three or more failed login attempts and prints an alert.
     
-    :param login_list: List of usernames representing failed login attempts.
+    :param login_list: List of usernames representing failed login attempts,
+                       or a table built by build_attempts_table.
     :param current_user: The username to check.
     """
     failed_attempts = count_failed_attempts(login_list, current_user)
     
-    if failed_attempts >= 3:
+    if failed_attempts >= LOCKOUT_THRESHOLD:
+        count("login_check.locked")
         print(f"ALERT: Account for user '{current_user}' is locked due to multiple failed login attempts.")
     else:
         print(f"User '{current_user}' can log in. Failed attempts: {failed_attempts}")
 
+def users_over_threshold(attempts_table: Mapping[str, int], threshold: int = LOCKOUT_THRESHOLD) -> Dict[str, int]:
+    """
+    Reports every user whose failed login attempts are at or over the threshold.
+    
+    :param attempts_table: Table built by build_attempts_table.
+    :param threshold: Minimum number of failed attempts to report.
+    :return: Dictionary of username -> failed attempts, most attempts first.
+    """
+    flagged = [(user, attempts) for user, attempts in attempts_table.items() if attempts >= threshold]
+    flagged.sort(key=lambda item: item[1], reverse=True)
+    return dict(flagged)
+
+def parse_timed_attempt(line: str) -> Optional[Tuple[float, str]]:
+    """
+    Parses a timestamped failed-login line into (epoch seconds, username).
+    
+    Accepted formats are "<timestamp> <username>" and "<timestamp> - <username>",
+    where the timestamp is ISO 8601 (as written by write_log) or epoch seconds.
+    
+    :param line: A single line of the log file.
+    :return: Tuple (timestamp, username), or None if the line cannot be parsed.
+    """
+    line = line.strip()
+    if " - " in line:
+        stamp, _, username = line.rpartition(" - ")
+    else:
+        stamp, _, username = line.rpartition(" ")
+    username = username.strip()
+    if not stamp or not username:
+        return None
+    
+    try:
+        return float(stamp), username
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(stamp.strip()).timestamp(), username
+    except ValueError:
+        return None
+
+class SlidingWindowLockout:
+    """
+    Time-aware lockout engine: a user is locked once they have `threshold` or more
+    failed attempts within the last `window` seconds.
+    
+    Each user keeps a ring buffer of their last `threshold` attempt times, so an
+    event costs O(1) and the K-th most recent attempt decides the lockout. Users
+    whose newest attempt has left the window are evicted, keeping memory bounded
+    by the number of active users rather than by the length of the history.
+    """
+    
+    def __init__(self, threshold: int = LOCKOUT_THRESHOLD, window: float = LOCKOUT_WINDOW):
+        """
+        :param threshold: Number of failures within the window that locks an account.
+        :param window: Length of the sliding window in seconds.
+        """
+        if threshold < 1 or window <= 0:
+            raise ValueError("Threshold must be >= 1 and window must be > 0.")
+        self.threshold = threshold
+        self.window = window
+        self._attempts: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._now = float("-inf")
+    
+    def record(self, current_user: str, timestamp: float) -> bool:
+        """
+        Records a failed login attempt and reports whether the user is now locked.
+        
+        :param current_user: The username of the failed attempt.
+        :param timestamp: Time of the attempt in epoch seconds.
+        :return: True if the user is locked after this attempt.
+        """
+        self._now = max(self._now, timestamp)
+        ring = self._attempts.get(current_user)
+        if ring is None:
+            ring = self._attempts[current_user] = deque(maxlen=self.threshold)
+        ring.append(timestamp)
+        self._attempts.move_to_end(current_user)
+        self._expire(self._now)
+        return self.is_locked(current_user, self._now)
+    
+    def is_locked(self, current_user: str, now: Optional[float] = None) -> bool:
+        """
+        Checks if a user has `threshold` or more failures in the last `window` seconds.
+        
+        :param current_user: The username to check.
+        :param now: Reference time in epoch seconds. Defaults to the latest recorded event.
+        :return: True if the account is locked.
+        """
+        ring = self._attempts.get(current_user)
+        if ring is None or len(ring) < self.threshold:
+            return False
+        now = self._now if now is None else now
+        return ring[0] > now - self.window
+    
+    def failures_in_window(self, current_user: str, now: Optional[float] = None) -> int:
+        """
+        Counts a user's failures in the last `window` seconds, capped at `threshold`.
+        
+        :param current_user: The username to check.
+        :param now: Reference time in epoch seconds. Defaults to the latest recorded event.
+        :return: Number of recent failures (at most `threshold`).
+        """
+        now = self._now if now is None else now
+        ring = self._attempts.get(current_user, ())
+        return sum(1 for timestamp in ring if timestamp > now - self.window)
+    
+    def locked_users(self, now: Optional[float] = None) -> List[str]:
+        """
+        Lists every currently locked user.
+        
+        :param now: Reference time in epoch seconds. Defaults to the latest recorded event.
+        :return: List of locked usernames.
+        """
+        return [user for user in self._attempts if self.is_locked(user, now)]
+    
+    def feed(self, lines: Iterable[str]) -> Iterator[Tuple[str, float]]:
+        """
+        Consumes timestamped log lines (a file or a live stream) and yields lockouts.
+        
+        :param lines: Iterable of "<timestamp> <username>" lines.
+        :return: Iterator of (username, timestamp) each time an account becomes locked.
+        """
+        for line in lines:
+            attempt = parse_timed_attempt(line)
+            if attempt is None:
+                continue
+            timestamp, username = attempt
+            was_locked = self.is_locked(username, timestamp)
+            if self.record(username, timestamp) and not was_locked:
+                yield username, timestamp
+    
+    def _expire(self, now: float) -> None:
+        """Evicts users whose newest attempt is older than the window (amortized O(1))."""
+        cutoff = now - self.window
+        while self._attempts:
+            user, ring = next(iter(self._attempts.items()))
+            if ring[-1] > cutoff:
+                break
+            del self._attempts[user]
+
+def scan_lockouts(file_path: str, threshold: int = LOCKOUT_THRESHOLD,
+                  window: float = LOCKOUT_WINDOW) -> Dict[str, float]:
+    """
+    Batch mode: streams a timestamped log file and reports when each user was first locked.
+    
+    :param file_path: Path to a timestamped log file.
+    :param threshold: Number of failures within the window that locks an account.
+    :param window: Length of the sliding window in seconds.
+    :return: Dictionary of username -> timestamp of the first lockout.
+    """
+    engine = SlidingWindowLockout(threshold, window)
+    first_lockouts: Dict[str, float] = {}
+    for username, timestamp in engine.feed(iter_log_file(file_path)):
+        first_lockouts.setdefault(username, timestamp)
+    return first_lockouts
+
+def timed_login_check(engine: SlidingWindowLockout, current_user: str, now: Optional[float] = None) -> None:
+    """
+    Rate-based counterpart of login_check: prints an alert if the user is locked
+    within the engine's sliding window.
+    
+    :param engine: The lockout engine holding the recent attempts.
+    :param current_user: The username to check.
+    :param now: Reference time in epoch seconds. Defaults to the latest recorded event.
+    """
+    if engine.is_locked(current_user, now):
+        print(f"ALERT: Account for user '{current_user}' is locked due to {engine.threshold} "
+              f"failed login attempts within {engine.window:g} seconds.")
+    else:
+        failed_attempts = engine.failures_in_window(current_user, now)
+        print(f"User '{current_user}' can log in. Recent failed attempts: {failed_attempts}")
+
 # Example usage
 if __name__ == "__main__":
     log_file_path = "failed_logins.txt"  # Example log file
@@ -50,3 +269,8 @@ if __name__ == "__main__":
     # Example check for a specific user
     user_to_check = "eraab"
     login_check(login_attempts, user_to_check)
+    
+    # Single pass over the file, then O(1) checks for every user
+    attempts_table = build_attempts_table(log_file_path)
+    for user, failed_attempts in users_over_threshold(attempts_table).items():
+        print(f"ALERT: '{user}' has {failed_attempts} failed login attempts.")
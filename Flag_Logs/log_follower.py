@@ -0,0 +1,317 @@
+import os
+import sys
+import json
+import time
+import struct
+import select
+import asyncio
+import threading
+import ctypes
+import ctypes.util
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+
+# inotify(7) event masks
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+READ_CHUNK_SIZE = 1 << 16
+BatchCallback = Callable[[List[str]], None]
+
+
+class _ChangeNotifier:
+    """
+    Waits for changes to a file through inotify on its directory (so rotation by
+    rename or re-creation is seen too), or by sleeping when inotify is unavailable.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        :param file_path: Path to the watched file
+        """
+        self._name = os.fsencode(os.path.basename(file_path))
+        self._fd: Optional[int] = None
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return
+            directory = os.path.dirname(os.path.abspath(file_path))
+            if libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK) < 0:
+                os.close(fd)
+                return
+            self._fd = fd
+        except (OSError, AttributeError):
+            self._fd = None  # Fall back to polling
+
+    @property
+    def uses_inotify(self) -> bool:
+        """True if change notifications come from inotify rather than polling."""
+        return self._fd is not None
+
+    def fileno(self) -> Optional[int]:
+        """Returns the inotify file descriptor, or None when polling."""
+        return self._fd
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Blocks until the watched file changes or the timeout expires.
+
+        :param timeout: Maximum time to wait in seconds
+        :return: True if a change to the watched file was reported
+        """
+        if self._fd is None:
+            time.sleep(timeout)
+            return False
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        return bool(readable) and self.drain()
+
+    def drain(self) -> bool:
+        """
+        Consumes pending inotify events.
+
+        :return: True if any event concerns the watched file
+        """
+        relevant = False
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return relevant
+            offset = 0
+            while offset < len(data):
+                _, mask, _, name_length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + name_length].rstrip(b"\0")
+                offset += name_length
+                if name == self._name or mask & IN_Q_OVERFLOW:
+                    relevant = True
+
+    def close(self) -> None:
+        """Releases the inotify file descriptor."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class OffsetStore:
+    """
+    Persists the (inode, offset) reached in each followed file to a small JSON file,
+    so a follower resumes where it stopped after a restart.
+    """
+
+    def __init__(self, store_path: str):
+        """
+        :param store_path: Path to the JSON file holding the offsets
+        """
+        self.store_path = store_path
+        self._lock = threading.Lock()
+        self._offsets: Dict[str, Dict[str, int]] = {}
+        if os.path.exists(store_path):
+            with open(store_path, 'r') as store_file:
+                self._offsets = json.load(store_file)
+
+    def get(self, file_path: str) -> Optional[Dict[str, int]]:
+        """
+        Returns the saved position of a file.
+
+        :param file_path: Path to the followed file
+        :return: Dictionary with "inode" and "offset", or None if never saved
+        """
+        return self._offsets.get(os.path.abspath(file_path))
+
+    def save(self, file_path: str, inode: int, offset: int) -> None:
+        """
+        Saves the position of a file, replacing the store atomically.
+
+        :param file_path: Path to the followed file
+        :param inode: Inode of the file the offset refers to
+        :param offset: Byte offset after the last delivered line
+        """
+        with self._lock:
+            self._offsets[os.path.abspath(file_path)] = {"inode": inode, "offset": offset}
+            temp_path = f"{self.store_path}.tmp"
+            with open(temp_path, 'w') as store_file:
+                json.dump(self._offsets, store_file)
+            os.replace(temp_path, self.store_path)
+
+
+class LogFollower:
+    """
+    Follows a log file like `tail -F`: new complete lines are delivered in batches to
+    callbacks, a blocking iterator or an async iterator. Rotation is detected by inode
+    change (rename) or size shrink (truncate), and the position can be persisted.
+    """
+
+    def __init__(self, file_path: str, callbacks: Optional[List[BatchCallback]] = None,
+                 batch_size: int = 1000, poll_interval: float = 0.05,
+                 offset_store: Optional[OffsetStore] = None, from_end: bool = True):
+        """
+        :param file_path: Path to the log file
+        :param callbacks: Functions called with each batch of new lines
+        :param batch_size: Maximum number of lines per batch
+        :param poll_interval: Seconds between checks when inotify is unavailable, and
+                              upper bound on the wait when it is
+        :param offset_store: Where to persist and resume the read position
+        :param from_end: Start at the end of the file when there is no saved position
+        """
+        self.file_path = file_path
+        self.callbacks: List[BatchCallback] = list(callbacks or [])
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.offset_store = offset_store
+        self._notifier = _ChangeNotifier(file_path)
+        self._file = None
+        self._inode: Optional[int] = None
+        self._pending = b""
+        self._open(from_end)
+
+    def _open(self, from_end: bool) -> None:
+        """Opens the log file at the saved offset, its end, or its start."""
+        try:
+            self._file = open(self.file_path, 'rb')
+        except FileNotFoundError:
+            self._file = None  # Picked up once the file is created
+            return
+        stat = os.fstat(self._file.fileno())
+        self._inode = stat.st_ino
+        self._pending = b""
+        saved = self.offset_store.get(self.file_path) if self.offset_store else None
+        if saved and saved["inode"] == stat.st_ino and saved["offset"] <= stat.st_size:
+            self._file.seek(saved["offset"])
+        elif from_end:
+            self._file.seek(0, os.SEEK_END)
+
+    @property
+    def offset(self) -> int:
+        """Byte offset just after the last complete line read."""
+        return self._file.tell() - len(self._pending) if self._file else 0
+
+    def add_callback(self, callback: BatchCallback) -> None:
+        """
+        Registers a function to receive each batch of new lines.
+
+        :param callback: Function called with a list of lines
+        """
+        self.callbacks.append(callback)
+
+    def _read_lines(self) -> List[str]:
+        """Reads every complete line available in the current file handle."""
+        lines: List[str] = []
+        while True:
+            chunk = self._file.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return lines
+            parts = (self._pending + chunk).split(b"\n")
+            self._pending = parts.pop()
+            lines.extend(part.decode(errors="replace").rstrip("\r") for part in parts)
+
+    def poll(self) -> List[str]:
+        """
+        Returns the lines appended since the last call without blocking, handling rotation.
+
+        :return: List of new lines, without trailing newlines
+        """
+        if self._file is None:
+            self._open(from_end=False)
+            if self._file is None:
+                return []
+
+        lines = self._read_lines()
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return lines  # Rotated away and not recreated yet: keep the old handle
+
+        if stat.st_ino != self._inode:
+            # Renamed: the old handle was drained above, continue with the new file
+            self._file.close()
+            self._open(from_end=False)
+            if self._file is not None:
+                lines.extend(self._read_lines())
+        elif stat.st_size < self.offset:
+            # Truncated in place
+            self._file.seek(0)
+            self._pending = b""
+            lines.extend(self._read_lines())
+        return lines
+
+    def _split_batches(self, lines: List[str]) -> Iterator[List[str]]:
+        """Splits lines into batches of at most batch_size and saves the offset after the last one."""
+        for start in range(0, len(lines), self.batch_size):
+            yield lines[start:start + self.batch_size]
+        if lines and self.offset_store and self._inode is not None:
+            self.offset_store.save(self.file_path, self._inode, self.offset)
+
+    def batches(self, stop_event: Optional[threading.Event] = None) -> Iterator[List[str]]:
+        """
+        Blocks waiting for changes and yields batches of new lines until stopped.
+
+        :param stop_event: Event that ends the iteration when set
+        :return: Iterator over batches of new lines
+        """
+        while stop_event is None or not stop_event.is_set():
+            yield from self._split_batches(self.poll())
+            self._notifier.wait(self.poll_interval if not self._notifier.uses_inotify else 1.0)
+
+    def run(self, stop_event: Optional[threading.Event] = None) -> None:
+        """
+        Follows the file and dispatches every batch to the registered callbacks.
+
+        :param stop_event: Event that stops following when set
+        """
+        for batch in self.batches(stop_event):
+            for callback in self.callbacks:
+                callback(batch)
+
+    async def abatches(self) -> AsyncIterator[List[str]]:
+        """
+        Asynchronously yields batches of new lines, waking on inotify events through
+        the event loop (or sleeping for poll_interval when polling).
+
+        :return: Async iterator over batches of new lines
+        """
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        fd = self._notifier.fileno()
+        if fd is not None:
+            loop.add_reader(fd, lambda: self._notifier.drain() and changed.set())
+        try:
+            while True:
+                # Clear before polling, so an event fired while the consumer handles a batch
+                # wakes the next wait at once instead of being lost
+                changed.clear()
+                for batch in self._split_batches(self.poll()):
+                    yield batch
+                try:
+                    await asyncio.wait_for(changed.wait(), self.poll_interval if fd is None else 1.0)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if fd is not None:
+                loop.remove_reader(fd)
+
+    def __aiter__(self) -> AsyncIterator[List[str]]:
+        return self.abatches()
+
+    def close(self) -> None:
+        """Closes the file handle and the change notifier."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._notifier.close()
+
+    def __enter__(self) -> "LogFollower":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
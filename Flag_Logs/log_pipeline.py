@@ -0,0 +1,176 @@
+import re
+import time
+import heapq
+import asyncio
+import inspect
+import itertools
+from collections import deque
+from typing import Awaitable, Callable, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from logIn_attempts import LOCKOUT_THRESHOLD, LOCKOUT_WINDOW, SlidingWindowLockout
+from log_follower import LogFollower
+from logs_files_handling import parse_line_timestamp
+from pattern_matching import compile_rules
+
+
+class LogEvent(NamedTuple):
+    """A single log line flowing through the pipeline."""
+    source: str
+    line: str
+    timestamp: float
+    alerts: Tuple[str, ...] = ()
+
+
+StageResult = Union[Optional[LogEvent], Awaitable[Optional[LogEvent]]]
+Stage = Callable[[LogEvent], StageResult]
+Sink = Callable[[LogEvent], Union[None, Awaitable[None]]]
+
+
+def regex_stage(patterns: Iterable[str] = (), literals: Iterable[str] = ()) -> Stage:
+    """
+    Builds a detect_anomalies-style stage that tags events with the rules they fire.
+
+    :param patterns: Regular expression rules
+    :param literals: Literal keyword rules
+    :return: Stage adding an "anomaly:<rule>" alert for every fired rule
+    """
+    matcher = compile_rules(literals, patterns)
+
+    def stage(event: LogEvent) -> LogEvent:
+        fired = matcher.match(event.line)
+        if not fired:
+            return event
+        return event._replace(alerts=event.alerts + tuple(f"anomaly:{rule}" for rule in fired))
+
+    return stage
+
+
+def threshold_stage(user_pattern: str = r"user[= ]'?(\w+)", threshold: int = LOCKOUT_THRESHOLD,
+                    window: float = LOCKOUT_WINDOW, failure_pattern: str = r"(?i)fail") -> Stage:
+    """
+    Builds a login_check-style stage that raises a lockout alert when a user fails
+    `threshold` times within `window` seconds.
+
+    :param user_pattern: Regex whose first group captures the username
+    :param threshold: Number of failures within the window that locks an account
+    :param window: Length of the sliding window in seconds
+    :param failure_pattern: Regex identifying failed-login lines
+    :return: Stage adding a "lockout:<user>" alert when an account becomes locked
+    """
+    user_regex = re.compile(user_pattern)
+    failure_regex = re.compile(failure_pattern)
+    engine = SlidingWindowLockout(threshold, window)
+
+    def stage(event: LogEvent) -> LogEvent:
+        if not failure_regex.search(event.line):
+            return event
+        match = user_regex.search(event.line)
+        if match is None:
+            return event
+        username = match.group(1)
+        was_locked = engine.is_locked(username, event.timestamp)
+        if engine.record(username, event.timestamp) and not was_locked:
+            return event._replace(alerts=event.alerts + (f"lockout:{username}",))
+        return event
+
+    return stage
+
+
+class LogPipeline:
+    """
+    Follows many log files concurrently in one event loop, merges their lines into a
+    single timestamp-ordered stream and runs them through detector stages.
+
+    Every hop is a bounded asyncio.Queue, so a slow stage or sink applies backpressure
+    all the way back to the file readers instead of buffering without limit.
+    """
+
+    def __init__(self, file_paths: Iterable[str], stages: Iterable[Stage], sink: Sink,
+                 queue_size: int = 1000, reorder_delay: float = 0.1, from_end: bool = True):
+        """
+        :param file_paths: Paths of the log files to follow
+        :param stages: Functions (sync or async) applied in order; returning None drops the event
+        :param sink: Function (sync or async) receiving every event leaving the last stage
+        :param queue_size: Capacity of each queue between pipeline steps
+        :param reorder_delay: Seconds an event is held to be ordered against the other files
+        :param from_end: Start each file at its end instead of its beginning
+        """
+        self.file_paths: List[str] = list(file_paths)
+        self.stages: List[Stage] = list(stages)
+        self.sink = sink
+        self.queue_size = queue_size
+        self.reorder_delay = reorder_delay
+        self.from_end = from_end
+
+    async def _follow(self, file_path: str, outbox: asyncio.Queue) -> None:
+        """Reads new lines from one file and feeds them to the merge queue."""
+        with LogFollower(file_path, from_end=self.from_end) as follower:
+            async for batch in follower:
+                for line in batch:
+                    timestamp = parse_line_timestamp(line)
+                    await outbox.put(LogEvent(file_path, line, time.time() if timestamp is None else timestamp))
+
+    async def _reorder(self, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        """
+        Merges events from all files in timestamp order: each event is held for
+        reorder_delay, and when its delay expires the earliest buffered event is released.
+        """
+        loop = asyncio.get_running_loop()
+        heap: List[Tuple[float, int, LogEvent]] = []
+        arrivals: deque = deque()
+        sequence = itertools.count()
+        while True:
+            timeout = None if not arrivals else max(0.0, arrivals[0] + self.reorder_delay - loop.time())
+            try:
+                event = await asyncio.wait_for(inbox.get(), timeout)
+                heapq.heappush(heap, (event.timestamp, next(sequence), event))
+                arrivals.append(loop.time())
+            except asyncio.TimeoutError:
+                pass
+            while arrivals and arrivals[0] + self.reorder_delay <= loop.time():
+                arrivals.popleft()
+                await outbox.put(heapq.heappop(heap)[2])
+
+    @staticmethod
+    async def _run_stage(stage: Stage, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        """Applies one stage to every event, forwarding the ones it keeps."""
+        while True:
+            event = await inbox.get()
+            result = stage(event)
+            if inspect.isawaitable(result):
+                result = await result
+            if result is not None:
+                await outbox.put(result)
+
+    async def _drain(self, inbox: asyncio.Queue) -> None:
+        """Hands every event leaving the last stage to the sink."""
+        while True:
+            result = self.sink(await inbox.get())
+            if inspect.isawaitable(result):
+                await result
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """
+        Runs the pipeline until the stop event is set (or forever).
+
+        :param stop_event: Event that stops the pipeline when set
+        """
+        queues = [asyncio.Queue(self.queue_size) for _ in range(len(self.stages) + 2)]
+        coroutines = [self._follow(file_path, queues[0]) for file_path in self.file_paths]
+        coroutines.append(self._reorder(queues[0], queues[1]))
+        for index, stage in enumerate(self.stages):
+            coroutines.append(self._run_stage(stage, queues[index + 1], queues[index + 2]))
+        coroutines.append(self._drain(queues[-1]))
+
+        tasks = [asyncio.create_task(coroutine) for coroutine in coroutines]
+        waiter = asyncio.create_task((stop_event or asyncio.Event()).wait())
+        try:
+            # Stop on request, or as soon as a step fails so its error is not swallowed
+            done, _ = await asyncio.wait(tasks + [waiter], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not waiter:
+                    task.result()
+        finally:
+            for task in tasks + [waiter]:
+                task.cancel()
+            await asyncio.gather(*tasks, waiter, return_exceptions=True)
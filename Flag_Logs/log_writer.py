@@ -0,0 +1,146 @@
+import os
+import time
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class BufferedLogWriter:
+    """
+    Long-lived, thread-safe log writer that keeps the file open and buffers messages.
+
+    The buffer is written out when it reaches `buffer_size` characters, when `flush_interval`
+    seconds have passed since the last flush (checked on write, or continuously by an
+    optional background thread), or on an explicit flush()/close(). With `max_bytes`
+    set, the file is rotated like logrotate: file -> file.1 -> file.2 ... -> file.N.
+    """
+
+    def __init__(self, file_path: str, buffer_size: int = 64 * 1024, flush_interval: float = 1.0,
+                 background_flush: bool = False, max_bytes: Optional[int] = None, backup_count: int = 5):
+        """
+        :param file_path: Path to the log file
+        :param buffer_size: Number of buffered characters that triggers a flush
+        :param flush_interval: Maximum seconds a message may stay buffered
+        :param background_flush: Start a daemon thread flushing every flush_interval
+        :param max_bytes: Rotate the file before it grows past this many bytes (None disables rotation)
+        :param backup_count: Number of rotated files to keep
+        """
+        self.file_path = file_path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._file = open(file_path, 'ab')
+        self._size = self._file.tell()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if background_flush:
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+
+    def write(self, message: str) -> None:
+        """
+        Buffers a log message with a timestamp, in the same format as write_log.
+
+        :param message: Log message to write
+        """
+        entry = f"{datetime.now()} - {message}\n"
+        with self._lock:
+            if self._closed.is_set():
+                raise ValueError("Cannot write to a closed log writer.")
+            self._buffer.append(entry)
+            self._buffered += len(entry)
+            if self._buffered >= self.buffer_size or time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Writes every buffered message to the file."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Writes the buffer out; the caller must hold the lock."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        data = "".join(self._buffer).encode()
+        self._buffer.clear()
+        self._buffered = 0
+        if self.max_bytes is not None and self._size and self._size + len(data) > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _rotate(self) -> None:
+        """Shifts file.N-1 -> file.N ... file -> file.1 and reopens an empty file."""
+        self._file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.file_path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.file_path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.file_path, f"{self.file_path}.1")
+        else:
+            os.remove(self.file_path)
+        self._file = open(self.file_path, 'ab')
+        self._size = 0
+
+    def _flush_periodically(self) -> None:
+        """Background thread body: flushes every flush_interval until closed."""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Flushes the remaining messages, stops the background thread and closes the file."""
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._flush_locked()
+            self._closed.set()
+            self._file.close()
+        if self._flusher is not None:
+            self._flusher.join()
+
+    def __enter__(self) -> "BufferedLogWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def benchmark_log_writers(messages: int = 100_000) -> Dict[str, float]:
+    """
+    Compares the throughput of write_log (open per message) and BufferedLogWriter.
+
+    :param messages: Number of messages written by each contender
+    :return: Dictionary of contender name -> messages per second
+    """
+    from logs_files_handling import write_log
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "benchmark.log")
+
+        start = time.perf_counter()
+        for number in range(messages):
+            write_log(file_path, f"benchmark message {number}")
+        results["write_log"] = messages / (time.perf_counter() - start)
+
+        os.remove(file_path)
+        start = time.perf_counter()
+        with BufferedLogWriter(file_path) as writer:
+            for number in range(messages):
+                writer.write(f"benchmark message {number}")
+        results["BufferedLogWriter"] = messages / (time.perf_counter() - start)
+    return results
+
+
+if __name__ == "__main__":
+    for name, rate in benchmark_log_writers().items():
+        print(f"{name}: {rate:,.0f} messages/sec")
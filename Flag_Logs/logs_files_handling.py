@@ -1,18 +1,153 @@
 import os
-import time
 import re
+import mmap
+import sqlite3
 from datetime import datetime
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
+from log_follower import LogFollower, OffsetStore
+from pattern_matching import compile_rules
 
-def write_log(file_path: str, message: str) -> None:
+
+TOKEN_PATTERN = re.compile(r"\w+")
+INDEX_SUFFIX = ".idx"
+READ_CHUNK_SIZE = 1 << 20  # 1 MiB
+INDEX_BATCH_LINES = 50_000  # Lines indexed per transaction
+LOG_ENCODING = "utf-8"  # Used by every read path, so whole-file and byte-range reads agree
+INDEX_VERSION = 2  # Bump to rebuild indexes written with an older schema
+
+
+def write_log(file_path: str, message: str, index: bool = False) -> None:
     """
     Writes a log message to the specified log file with a timestamp.
     
+    For many messages, keep a log_writer.BufferedLogWriter open instead of calling this per message.
+    
     :param file_path: Path to the log file
     :param message: Log message to write
+    :param index: If True, bring the sidecar index up to date after writing
     """
     with open(file_path, 'a') as log_file:
         log_file.write(f"{datetime.now()} - {message}\n")
+    
+    if index:
+        update_index(file_path)
+
+
+def iter_logs(file_path: str, start: int = 0, end: Optional[int] = None,
+              limit: Optional[int] = None, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Lazily yields the lines of a log file, reading it in large buffered chunks.
+    
+    The whole file is read in text mode; a byte range is read in binary mode. Both
+    decode LOG_ENCODING, replacing invalid bytes. A line belongs to the byte range in
+    which it starts, so adjacent ranges (e.g. [0, n) and [n, size)) never yield the
+    same line twice.
+    
+    :param file_path: Path to the log file
+    :param start: Byte offset to start reading from
+    :param end: Byte offset to stop at (exclusive), or None for end of file
+    :param limit: Maximum number of lines to yield, or None for no limit
+    :param chunk_size: Number of bytes read per system call
+    :return: Iterator over log lines
+    """
+    if not os.path.exists(file_path) or (limit is not None and limit <= 0):
+        return
+    
+    if start <= 0 and end is None:
+        # Whole file: the buffered C readline of a text file beats splitting chunks in Python
+        with open(file_path, 'r', encoding=LOG_ENCODING, errors="replace", buffering=chunk_size) as log_file:
+            yield from islice(log_file, limit)
+        return
+    
+    with open(file_path, 'rb') as log_file:
+        if start > 0:
+            log_file.seek(start - 1)
+            if log_file.read(1) != b"\n":
+                log_file.readline()  # Skip the line owned by the previous range
+        position = log_file.tell()
+        pending = b""
+        yielded = 0
+        while True:
+            chunk = log_file.read(chunk_size)
+            if not chunk:
+                break
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for raw_line in lines:
+                if end is not None and position >= end:
+                    return
+                position += len(raw_line) + 1
+                yield _decode_line(raw_line + b"\n")
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+        if pending and (end is None or position < end):
+            yield _decode_line(pending)
+
+
+def _decode_line(raw_line: bytes) -> str:
+    """Decodes a raw line, normalizing Windows line endings like text mode does."""
+    if raw_line.endswith(b"\r\n"):
+        raw_line = raw_line[:-2] + b"\n"
+    return raw_line.decode(LOG_ENCODING, errors="replace")
+
+
+def iter_search_logs(file_path: str, keyword: str, limit: Optional[int] = None,
+                     start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """
+    Lazily yields the log lines containing a keyword as they are found.
+    
+    :param file_path: Path to the log file
+    :param keyword: Keyword to search for in the logs
+    :param limit: Stop after this many matches, or None for all matches
+    :param start: Byte offset to start searching from
+    :param end: Byte offset to stop at (exclusive), or None for end of file
+    :return: Iterator over matching log lines
+    """
+    matches = (line for line in iter_logs(file_path, start, end) if keyword in line)
+    return islice(matches, limit)
+
+
+def iter_detect_anomalies(file_path: str, pattern: Union[str, Iterable[str]], limit: Optional[int] = None,
+                          start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """
+    Lazily yields the log lines matching a regex pattern as they are found.
+    
+    :param file_path: Path to the log file
+    :param pattern: Regular expression pattern to match anomalies, or several patterns
+                    (a line matches if any of them does)
+    :param limit: Stop after this many matches, or None for all matches
+    :param start: Byte offset to start searching from
+    :param end: Byte offset to stop at (exclusive), or None for end of file
+    :return: Iterator over log lines that match the pattern
+    """
+    if isinstance(pattern, str):
+        regex_search = re.compile(pattern).search
+    else:
+        regex_search = compile_rules(regexes=pattern).search
+    matches = (line for line in iter_logs(file_path, start, end) if regex_search(line))
+    return islice(matches, limit)
+
+
+def iter_detect_anomaly_rules(file_path: str, regexes: Iterable[str] = (), literals: Iterable[str] = (),
+                              limit: Optional[int] = None, start: int = 0,
+                              end: Optional[int] = None) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Lazily scans the log file once against a whole rule set and reports which rules fired.
+    
+    :param file_path: Path to the log file
+    :param regexes: Regular expression rules
+    :param literals: Literal keyword rules (matched as substrings)
+    :param limit: Stop after this many matching lines, or None for all of them
+    :param start: Byte offset to start searching from
+    :param end: Byte offset to stop at (exclusive), or None for end of file
+    :return: Iterator of (log line, fired rules) for every line where a rule fired
+    """
+    matcher = compile_rules(literals, regexes)
+    fired_rules = ((line, matcher.match(line)) for line in iter_logs(file_path, start, end))
+    return islice(((line, fired) for line, fired in fired_rules if fired), limit)
 
 
 def read_logs(file_path: str) -> list:
@@ -22,11 +157,7 @@ def read_logs(file_path: str) -> list:
     :param file_path: Path to the log file
     :return: List of log lines
     """
-    if not os.path.exists(file_path):
-        return []
-    
-    with open(file_path, 'r') as log_file:
-        return log_file.readlines()
+    return list(iter_logs(file_path))
 
 
 def search_logs(file_path: str, keyword: str) -> list:
@@ -37,8 +168,7 @@ def search_logs(file_path: str, keyword: str) -> list:
     :param keyword: Keyword to search for in the logs
     :return: List of matching log lines
     """
-    logs = read_logs(file_path)
-    return [line for line in logs if keyword in line]
+    return list(iter_search_logs(file_path, keyword))
 
 
 def detect_anomalies(file_path: str, pattern: str) -> list:
@@ -49,26 +179,286 @@ def detect_anomalies(file_path: str, pattern: str) -> list:
     :param pattern: Regular expression pattern to match anomalies
     :return: List of log lines that match the pattern
     """
-    logs = read_logs(file_path)
-    regex = re.compile(pattern)
-    return [line for line in logs if regex.search(line)]
+    return list(iter_detect_anomalies(file_path, pattern))
 
 
-def monitor_log(file_path: str):
+def detect_anomaly_rules(file_path: str, regexes: Iterable[str] = (), literals: Iterable[str] = ()) -> list:
+    """
+    Detects anomalies for a whole rule set and reports which rules fired on each line.
+    
+    :param file_path: Path to the log file
+    :param regexes: Regular expression rules
+    :param literals: Literal keyword rules
+    :return: List of (log line, fired rules) tuples
+    """
+    return list(iter_detect_anomaly_rules(file_path, regexes, literals))
+
+
+def parse_line_timestamp(line: str) -> Optional[float]:
+    """
+    Parses the "timestamp - message" prefix written by write_log.
+    
+    :param line: A single log line
+    :return: Timestamp in epoch seconds, or None if the line has no timestamp
+    """
+    stamp, separator, _ = line.partition(" - ")
+    if not separator:
+        return None
+    try:
+        return datetime.fromisoformat(stamp).timestamp()
+    except ValueError:
+        return None
+
+
+def _open_index(file_path: str) -> sqlite3.Connection:
+    """
+    Opens (and creates if needed) the sidecar index of a log file.
+    
+    The index holds an inverted token -> line offset table, the vocabulary of tokens with
+    a trigram -> token table to find the tokens containing a word, a line offset ->
+    timestamp table and the number of bytes of the log already covered.
+    
+    :param file_path: Path to the log file
+    :return: Connection to the index database
+    """
+    connection = sqlite3.connect(file_path + INDEX_SUFFIX)
+    connection.executescript("""
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS postings (
+            token TEXT, offset INTEGER, PRIMARY KEY (token, offset)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS tokens (token TEXT PRIMARY KEY) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS trigrams (
+            trigram TEXT, token TEXT, PRIMARY KEY (trigram, token)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS timestamps (offset INTEGER PRIMARY KEY, ts REAL);
+        CREATE INDEX IF NOT EXISTS timestamps_ts ON timestamps (ts);
+    """)
+    return connection
+
+
+def update_index(file_path: str) -> int:
+    """
+    Indexes the bytes appended to the log file since the last index build.
+    
+    Only complete lines are indexed; a trailing partial line is picked up on the next
+    call. If the log was truncated or replaced (rotation), the index is rebuilt.
+    
+    :param file_path: Path to the log file
+    :return: Number of lines added to the index
+    """
+    if not os.path.exists(file_path):
+        return 0
+    
+    stat = os.stat(file_path)
+    connection = _open_index(file_path)
+    try:
+        meta = dict(connection.execute("SELECT key, value FROM meta"))
+        indexed_bytes = meta.get("indexed_bytes", 0)
+        if (meta.get("inode", stat.st_ino) != stat.st_ino or stat.st_size < indexed_bytes
+                or (indexed_bytes and meta.get("version") != INDEX_VERSION)):
+            for table in ("postings", "tokens", "trigrams", "timestamps"):
+                connection.execute(f"DELETE FROM {table}")
+            indexed_bytes = 0
+        
+        postings = []
+        vocabulary = set()
+        timestamps = []
+        added = 0
+        
+        def flush(indexed_to: int) -> None:
+            """Writes the pending rows and the covered byte count in one transaction."""
+            connection.executemany("INSERT OR IGNORE INTO postings VALUES (?, ?)", postings)
+            connection.executemany("INSERT OR IGNORE INTO tokens VALUES (?)", ((token,) for token in vocabulary))
+            connection.executemany("INSERT OR IGNORE INTO trigrams VALUES (?, ?)",
+                                   ((trigram, token) for token in vocabulary for trigram in _trigrams(token)))
+            connection.executemany("INSERT OR REPLACE INTO timestamps VALUES (?, ?)", timestamps)
+            connection.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                                   [("indexed_bytes", indexed_to), ("inode", stat.st_ino),
+                                    ("version", INDEX_VERSION)])
+            connection.commit()
+            postings.clear()
+            vocabulary.clear()
+            timestamps.clear()
+        
+        with open(file_path, 'rb') as log_file:
+            log_file.seek(indexed_bytes)
+            offset = indexed_bytes
+            for raw_line in log_file:
+                if not raw_line.endswith(b"\n"):
+                    break
+                line = raw_line.decode(LOG_ENCODING, errors="replace")
+                tokens = set(TOKEN_PATTERN.findall(line.lower()))
+                postings.extend((token, offset) for token in tokens)
+                vocabulary.update(tokens)
+                timestamp = parse_line_timestamp(line)
+                if timestamp is not None:
+                    timestamps.append((offset, timestamp))
+                offset += len(raw_line)
+                added += 1
+                if added % INDEX_BATCH_LINES == 0:
+                    flush(offset)  # Bounds memory on first builds over large logs
+        
+        flush(offset)
+        return added
+    finally:
+        connection.close()
+
+
+def _trigrams(token: str) -> set:
+    """Returns the distinct three-character substrings of a token."""
+    return {token[position:position + 3] for position in range(len(token) - 2)}
+
+
+def _tokens_containing(connection: sqlite3.Connection, word: str) -> list:
+    """
+    Finds the indexed tokens that contain a word, through the trigram table.
+    
+    Words shorter than a trigram are matched against the vocabulary instead, which is
+    still far smaller than the log.
+    
+    :param connection: Connection to the index database
+    :param word: Lowercase word to look for inside tokens
+    :return: List of tokens containing the word
+    """
+    trigrams = _trigrams(word)
+    if not trigrams:
+        rows = connection.execute("SELECT token FROM tokens WHERE instr(token, ?) > 0", (word,))
+        return [row[0] for row in rows]
+    
+    candidates: Optional[set] = None
+    for trigram in trigrams:
+        tokens = {row[0] for row in connection.execute("SELECT token FROM trigrams WHERE trigram = ?", (trigram,))}
+        candidates = tokens if candidates is None else candidates & tokens
+        if not candidates:
+            return []
+    return [token for token in candidates if word in token]
+
+
+def _read_lines_at(file_path: str, offsets: Iterable[int]) -> list:
+    """
+    Reads the lines starting at the given byte offsets through a memory-mapped file.
+    
+    :param file_path: Path to the log file
+    :param offsets: Byte offsets of line starts, in the order to return them
+    :return: List of log lines
+    """
+    if os.path.getsize(file_path) == 0:
+        return []
+    
+    lines = []
+    with open(file_path, 'rb') as log_file:
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset in offsets:
+                end = mapped.find(b"\n", offset)
+                end = len(mapped) if end == -1 else end + 1
+                lines.append(mapped[offset:end].decode(LOG_ENCODING, errors="replace"))
+    return lines
+
+
+def indexed_search(file_path: str, keyword: str) -> list:
+    """
+    Searches for a keyword using the sidecar index instead of rescanning the file.
+    
+    Candidate lines are looked up by the words of the keyword (case-insensitive):
+    inner words must be whole tokens, a trailing word may be the start of a longer
+    token and a leading word may be the end of one. A keyword that is a single word
+    may sit anywhere inside a token, so the tokens containing it are found through
+    the trigram table. Candidates are then checked with the same substring test as
+    search_logs, so the results are exactly those of search_logs. Only keywords
+    without any word (e.g. punctuation) fall back to a full scan.
+    
+    :param file_path: Path to the log file
+    :param keyword: Keyword to search for in the logs
+    :return: List of matching log lines
+    """
+    if not os.path.exists(file_path):
+        return []
+    
+    lowered = keyword.lower()
+    words = list(TOKEN_PATTERN.finditer(lowered))
+    if not words:
+        return search_logs(file_path, keyword)
+    
+    update_index(file_path)
+    connection = _open_index(file_path)
+    try:
+        candidates: Optional[set] = None
+        for match in words:
+            word = match.group()
+            at_start, at_end = match.start() == 0, match.end() == len(lowered)
+            if at_start:
+                # May be the tail (or, if also at the end, any part) of a longer token
+                tokens = _tokens_containing(connection, word)
+                if not at_end:
+                    tokens = [token for token in tokens if token.endswith(word)]
+                offsets = set()
+                for token in tokens:
+                    offsets.update(row[0] for row in connection.execute(
+                        "SELECT offset FROM postings WHERE token = ?", (token,)))
+            elif at_end:
+                # May be the head of a longer token: range over every token starting with it
+                offsets = {row[0] for row in connection.execute(
+                    "SELECT offset FROM postings WHERE token >= ? AND token < ?", (word, word + "\U0010ffff"))}
+            else:
+                offsets = {row[0] for row in connection.execute(
+                    "SELECT offset FROM postings WHERE token = ?", (word,))}
+            candidates = offsets if candidates is None else candidates & offsets
+            if not candidates:
+                return []
+    finally:
+        connection.close()
+    
+    return [line for line in _read_lines_at(file_path, sorted(candidates)) if keyword in line]
+
+
+def indexed_time_range(file_path: str, start: datetime, end: datetime) -> list:
+    """
+    Returns the log lines whose write_log timestamp falls within [start, end].
+    
+    :param file_path: Path to the log file
+    :param start: Beginning of the time range
+    :param end: End of the time range
+    :return: List of log lines in the time range, in file order
+    """
+    if not os.path.exists(file_path):
+        return []
+    
+    update_index(file_path)
+    connection = _open_index(file_path)
+    try:
+        rows = connection.execute(
+            "SELECT offset FROM timestamps WHERE ts BETWEEN ? AND ? ORDER BY offset",
+            (start.timestamp(), end.timestamp()),
+        )
+        offsets: List[int] = [row[0] for row in rows]
+    finally:
+        connection.close()
+    
+    return _read_lines_at(file_path, offsets)
+
+
+def monitor_log(file_path: str, callback: Optional[Callable[[List[str]], None]] = None,
+                offset_store_path: Optional[str] = None):
     """
     Monitors the log file in real-time and prints new entries as they are added.
     
+    New lines are delivered in batches as soon as the file changes (inotify, with a
+    polling fallback), and log rotation by rename or truncation is followed.
+    
     :param file_path: Path to the log file
+    :param callback: Function receiving each batch of new lines (defaults to printing them)
+    :param offset_store_path: JSON file used to resume from the last position after a restart
     """
     if not os.path.exists(file_path):
         print("Log file does not exist.")
         return
     
-    with open(file_path, 'r') as log_file:
-        log_file.seek(0, os.SEEK_END)  # Move to the end of file
-        while True:
-            line = log_file.readline()
-            if line:
+    if callback is None:
+        def callback(lines: List[str]) -> None:
+            for line in lines:
                 print(line.strip())
-            else:
-                time.sleep(1)  # Wait for new lines to be written
\ No newline at end of file
+    
+    offset_store = OffsetStore(offset_store_path) if offset_store_path else None
+    with LogFollower(file_path, [callback], offset_store=offset_store) as follower:
+        follower.run()
@@ -0,0 +1,208 @@
+import re
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional
+
+from columnar_log import parse_ipv4
+
+
+MONTHS = {name: number for number, name in enumerate(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], start=1)}
+
+SYSLOG_PATTERN = re.compile(
+    r"^(?P<timestamp>[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d) (?P<host>\S+) "
+    r"(?P<program>[^\s\[:]+)(?:\[(?P<pid>\d+)\])?: (?P<message>.*)$"
+)
+COMBINED_PATTERN = re.compile(
+    r'^(?P<ip>\S+) \S+ (?P<user>\S+) \[(?P<timestamp>[^\]]+)\] '
+    r'"(?P<method>[A-Z]+) (?P<path>\S+) (?P<protocol>[^"]*)" (?P<status>\d{3}) (?P<size>\d+|-)'
+    r'(?: "(?P<referrer>[^"]*)" "(?P<user_agent>[^"]*)")?$'
+)
+WRITE_LOG_PATTERN = re.compile(
+    r"^(?P<timestamp>\d{4}-\d\d-\d\d[ T]\d\d:\d\d:\d\d(?:\.\d+)?) - (?P<message>.*)$"
+)
+# auth.log lines are syslog lines whose message names a user and a source address
+AUTH_PROGRAMS = frozenset({"sshd", "sudo", "su", "login", "systemd-logind", "CRON", "cron", "passwd"})
+AUTH_MESSAGE_PATTERN = re.compile(
+    r"(?:for (?:invalid )?user|for|user) (?P<user>[^\s;]+)(?: from (?P<ip>[\d.]+))?(?: port (?P<port>\d+))?"
+)
+COMBINED_TIME_PATTERN = re.compile(
+    r"^(?P<day>\d\d)/(?P<month>\w{3})/(?P<year>\d{4}):(?P<hour>\d\d):(?P<minute>\d\d):(?P<second>\d\d)"
+    r" (?P<sign>[+-])(?P<offset_hours>\d\d)(?P<offset_minutes>\d\d)$"
+)
+
+
+class LogRecord(NamedTuple):
+    """A parsed log line with typed fields; fields missing from the format are None."""
+    format: str
+    timestamp: Optional[datetime]
+    ip: Optional[int]
+    user: Optional[str]
+    status: Optional[int]
+    message: str
+    fields: Dict[str, str]
+
+
+def _parse_syslog_time(value: str, year: int) -> Optional[datetime]:
+    """Parses 'Mmm dd hh:mm:ss' (syslog has no year) without strptime."""
+    month = MONTHS.get(value[:3])
+    if month is None:
+        return None
+    return datetime(year, month, int(value[4:6]), int(value[7:9]), int(value[10:12]), int(value[13:15]))
+
+
+def _parse_combined_time(value: str) -> Optional[datetime]:
+    """Parses 'dd/Mmm/yyyy:hh:mm:ss +zzzz' without strptime."""
+    match = COMBINED_TIME_PATTERN.match(value)
+    if match is None or match["month"] not in MONTHS:
+        return None
+    offset = timedelta(hours=int(match["offset_hours"]), minutes=int(match["offset_minutes"]))
+    zone = timezone(offset if match["sign"] == "+" else -offset)
+    return datetime(int(match["year"]), MONTHS[match["month"]], int(match["day"]),
+                    int(match["hour"]), int(match["minute"]), int(match["second"]), tzinfo=zone)
+
+
+def _packed_ip(value: Optional[str]) -> Optional[int]:
+    """Packs an IPv4 address, returning None for missing or invalid values."""
+    if not value:
+        return None
+    return parse_ipv4(value)
+
+
+def _build_syslog(match: re.Match, year: int) -> LogRecord:
+    fields = match.groupdict()
+    return LogRecord("syslog", _parse_syslog_time(fields["timestamp"], year), None, None, None,
+                     fields["message"], fields)
+
+
+def _build_auth(match: re.Match, year: int) -> LogRecord:
+    fields = match.groupdict()
+    auth = AUTH_MESSAGE_PATTERN.search(fields["message"])
+    user = ip = None
+    if auth is not None:
+        fields.update({key: value for key, value in auth.groupdict().items() if value is not None})
+        user, ip = auth["user"], _packed_ip(auth["ip"])
+    return LogRecord("auth", _parse_syslog_time(fields["timestamp"], year), ip, user, None,
+                     fields["message"], fields)
+
+
+def _build_combined(match: re.Match, year: int) -> LogRecord:
+    fields = match.groupdict()
+    user = fields["user"] if fields["user"] != "-" else None
+    message = f'{fields["method"]} {fields["path"]} {fields["protocol"]}'
+    return LogRecord("combined", _parse_combined_time(fields["timestamp"]), _packed_ip(fields["ip"]), user,
+                     int(fields["status"]), message, fields)
+
+
+def _build_write_log(match: re.Match, year: int) -> LogRecord:
+    fields = match.groupdict()
+    return LogRecord("write_log", datetime.fromisoformat(fields["timestamp"]), None, None, None,
+                     fields["message"], fields)
+
+
+class Grammar(NamedTuple):
+    """A precompiled line pattern and the function turning its match into a LogRecord."""
+    pattern: re.Pattern
+    build: Callable[[re.Match, int], LogRecord]
+    accepts: Callable[[re.Match], bool] = lambda match: True
+
+
+# Checked in this order during detection: auth before syslog since auth is a syslog subset
+GRAMMARS: Dict[str, Grammar] = {
+    "auth": Grammar(SYSLOG_PATTERN, _build_auth, lambda match: match["program"] in AUTH_PROGRAMS),
+    "syslog": Grammar(SYSLOG_PATTERN, _build_syslog),
+    "combined": Grammar(COMBINED_PATTERN, _build_combined),
+    "write_log": Grammar(WRITE_LOG_PATTERN, _build_write_log),
+}
+
+
+def detect_format(sample: Iterable[str], min_ratio: float = 0.5) -> Optional[str]:
+    """
+    Infers the log format from a sample of lines.
+
+    :param sample: Sample lines of the log.
+    :param min_ratio: Minimum share of sample lines the winning grammar must parse.
+    :return: The name of the best-matching grammar, or None if none parses enough lines.
+    """
+    lines = [line.rstrip("\r\n") for line in sample if line.strip()]
+    if not lines:
+        return None
+    scores = {}
+    for name, grammar in GRAMMARS.items():
+        matches = (grammar.pattern.match(line) for line in lines)
+        scores[name] = sum(1 for match in matches if match is not None and grammar.accepts(match))
+    # A mostly-auth syslog file is still auth.log; otherwise prefer the grammar parsing most lines
+    if scores["auth"] and scores["auth"] >= scores["syslog"] * 0.5:
+        scores["auth"] = scores["syslog"]
+    best = max(scores, key=scores.get)
+    return best if scores[best] >= len(lines) * min_ratio else None
+
+
+class StructuredParser:
+    """
+    Parses log lines into typed LogRecords with one precompiled grammar, so detectors
+    can work on timestamps, packed IPs and status codes instead of re-parsing strings.
+    """
+
+    def __init__(self, log_format: str, year: Optional[int] = None):
+        """
+        :param log_format: One of GRAMMARS ("auth", "syslog", "combined", "write_log").
+        :param year: Year assumed for syslog timestamps, which have none (defaults to the current year).
+        """
+        if log_format not in GRAMMARS:
+            raise ValueError(f"Unknown log format '{log_format}'. Expected one of: {', '.join(GRAMMARS)}.")
+        self.log_format = log_format
+        self.year = year or datetime.now().year
+        grammar = GRAMMARS[log_format]
+        self._match = grammar.pattern.match
+        self._build = grammar.build
+
+    def parse_line(self, line: str) -> Optional[LogRecord]:
+        """
+        Parses a single line.
+
+        :param line: The log line.
+        :return: The typed record, or None if the line does not fit the grammar.
+        """
+        match = self._match(line.rstrip("\r\n"))
+        if match is None:
+            return None
+        try:
+            return self._build(match, self.year)
+        except ValueError:
+            return None  # Out-of-range date fields
+
+    def parse_lines(self, lines: Iterable[str]) -> Iterator[LogRecord]:
+        """
+        Lazily parses lines, skipping the ones that do not fit the grammar.
+
+        :param lines: Iterable of log lines.
+        :return: Iterator over the typed records.
+        """
+        parse_line = self.parse_line
+        for line in lines:
+            record = parse_line(line)
+            if record is not None:
+                yield record
+
+
+def parse_structured_log(file_path: str, log_format: Optional[str] = None,
+                         sample_size: int = 100) -> Iterator[LogRecord]:
+    """
+    Streams a log file as typed records, detecting the format from its first lines if needed.
+
+    :param file_path: Path to the log file.
+    :param log_format: Grammar to use, or None to infer it from a sample.
+    :param sample_size: Number of leading lines used for format detection.
+    :return: Iterator over the typed records.
+    """
+    if log_format is None:
+        with open(file_path, "r") as file:
+            log_format = detect_format(islice(file, sample_size))
+        if log_format is None:
+            raise ValueError(f"Could not detect the format of '{file_path}'.")
+
+    parser = StructuredParser(log_format)
+    with open(file_path, "r") as file:
+        yield from parser.parse_lines(file)
+
@@ -1,7 +1,10 @@
 import os
 import sys
+import json
+import time
 import platform
-from typing import Union, Dict, Any
+import threading
+from typing import Union, Dict, Any, Callable, Optional, Tuple
 
 try:
     import distro
@@ -38,19 +41,116 @@ def get_linux_distribution() -> Union[Dict[str, str], str]:
         }
     return "Module 'distro' not installed. Use 'pip install distro' for more details."
 
+def get_distribution_field() -> Union[Dict[str, str], str]:
+    """Returns the Linux distribution on Linux, 'N/A' elsewhere."""
+    return get_linux_distribution() if get_sys_platform() == 'linux' else "N/A"
+
+# Field name -> (probe, seconds before the value is probed again; None means never)
+SYSTEM_INFO_FIELDS: Dict[str, Tuple[Callable[[], Any], Optional[float]]] = {
+    "os_name": (get_os_name, None),
+    "sys_platform": (get_sys_platform, None),
+    "platform_system": (get_platform_system, None),
+    "platform_release": (get_platform_release, None),  # Only changes across a reboot
+    "platform_info": (get_platform_info, None),
+    "linux_distribution": (get_distribution_field, 3600.0),  # Can be upgraded in place
+}
+
+def collect_system_info() -> Dict[str, Any]:
+    """Probes every field afresh, without caching."""
+    return {name: getter() for name, (getter, _) in SYSTEM_INFO_FIELDS.items()}
+
+class SystemInfoSnapshot:
+    """
+    Lazily evaluated, memoized system information.
+
+    Each field is probed on first access only, and fields with a TTL are probed again once
+    it expires. The dictionary and JSON forms are built once and reused until a field expires
+    or is refreshed, so repeated calls cost a clock read and a comparison.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, Optional[float]]] = None):
+        """Optionally overrides the per-field TTLs of SYSTEM_INFO_FIELDS (None: never expires)."""
+        self._fields = {name: (getter, (ttls or {}).get(name, ttl))
+                        for name, (getter, ttl) in SYSTEM_INFO_FIELDS.items()}
+        self._values: Dict[str, Tuple[Any, float]] = {}  # name -> (value, monotonic expiry)
+        self._lock = threading.Lock()
+        # (dictionary, JSON, earliest expiry of their fields), swapped as one object so
+        # readers never see the two forms from different snapshots
+        self._forms: Optional[Tuple[Dict[str, Any], str, float]] = None
+
+    def get(self, name: str) -> Any:
+        """Returns one field, probing it only if it was never read or has expired."""
+        cached = self._values.get(name)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+        getter, ttl = self._fields[name]
+        with self._lock:
+            value = getter()
+            self._values[name] = (value, float("inf") if ttl is None else time.monotonic() + ttl)
+            self._forms = None
+        return value
+
+    def __getitem__(self, name: str) -> Any:
+        return self.get(name)
+
+    def refresh(self, name: Optional[str] = None) -> None:
+        """Forgets one field (or all of them) so it is probed again on next access."""
+        with self._lock:
+            if name is None:
+                self._values.clear()
+            else:
+                self._values.pop(name, None)
+            self._forms = None
+
+    def _snapshot(self) -> Tuple[Dict[str, Any], str, float]:
+        """Returns the cached dictionary and JSON of every field, rebuilding them when stale."""
+        forms = self._forms
+        if forms is not None and time.monotonic() < forms[2]:
+            return forms
+        snapshot = {name: self.get(name) for name in self._fields}
+        with self._lock:
+            # A field refreshed meanwhile has no expiry: the new forms are then already stale
+            expires = min(self._values.get(name, (None, 0.0))[1] for name in self._fields)
+            forms = self._forms = (snapshot, json.dumps(snapshot), expires)
+        return forms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a copy of every field, safe for the caller to modify."""
+        return dict(self._snapshot()[0])
+
+    def to_json(self) -> str:
+        """Returns every field serialized as JSON, computed once per snapshot."""
+        return self._snapshot()[1]
+
+SYSTEM_INFO = SystemInfoSnapshot()
+
 def get_full_system_info() -> Dict[str, Any]:
     """Returns a dictionary with all available system information."""
-    return {
-        "os_name": get_os_name(),
-        "sys_platform": get_sys_platform(),
-        "platform_system": get_platform_system(),
-        "platform_release": get_platform_release(),
-        "platform_info": get_platform_info(),
-        "linux_distribution": get_linux_distribution() if get_sys_platform() == 'linux' else "N/A"
-    }
+    return SYSTEM_INFO.to_dict()
+
+def benchmark_system_info(calls: int = 10000) -> Dict[str, float]:
+    """Returns the microseconds per call of uncached probing and of a cold and warm snapshot."""
+    results = {}
+    start = time.perf_counter()
+    for _ in range(calls):
+        collect_system_info()
+    results["collect_system_info"] = (time.perf_counter() - start) / calls * 1e6
+
+    snapshot = SystemInfoSnapshot()
+    start = time.perf_counter()
+    snapshot.to_json()
+    results["first to_json"] = (time.perf_counter() - start) * 1e6
+
+    for name, method in (("to_dict", snapshot.to_dict), ("to_json", snapshot.to_json)):
+        start = time.perf_counter()
+        for _ in range(calls):
+            method()
+        results[f"cached {name}"] = (time.perf_counter() - start) / calls * 1e6
+    return results
 
 # Test the module
 if __name__ == "__main__":
     info = get_full_system_info()
     for key, value in info.items():
-        print(f"{key}: {value}")
\ No newline at end of file
+        print(f"{key}: {value}")
+    # print(benchmark_system_info())
\ No newline at end of file
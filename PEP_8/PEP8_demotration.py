@@ -1,29 +1,280 @@
+import asyncio
 import hashlib
+import ipaddress
+import json
 import os
 import socket
 import random
 import requests
+import secrets
+import sqlite3
 import string
-from typing import List
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    from profiling_hooks import count, profiled
+except ImportError:
+    # No-op fallbacks when Benchmarks/ is not on the path; see the profiling_hooks docstring
+    def profiled(name=None):
+        return lambda function: function
+
+    def count(name, amount=1):
+        pass
 
 
 # 1. Hash Generator
 
+HASH_BUFFER_SIZE = 1 << 20  # 1 MiB per read
+_thread_buffers = threading.local()
+
+
+@profiled()
 def generate_hash(file_path: str, algorithm: str = "sha256") -> str:
     """Generate the hash of a file using the specified algorithm."""
-    hash_func = getattr(hashlib, algorithm, None)
-    if hash_func is None:
+    return hash_file(file_path, (algorithm,))[algorithm]
+
+
+def hash_file(file_path: str, algorithms: Sequence[str] = ("sha256",),
+              buffer_size: int = HASH_BUFFER_SIZE) -> Dict[str, str]:
+    """Hash a file with several algorithms in one pass, reading into a reusable per-thread buffer."""
+    hash_funcs = [getattr(hashlib, algorithm, None) for algorithm in algorithms]
+    if not algorithms or None in hash_funcs:
         raise ValueError("Invalid hash algorithm.")
-    
-    hasher = hash_func()
-    with open(file_path, "rb") as file:
-        for chunk in iter(lambda: file.read(4096), b""):
-            hasher.update(chunk)
-    
-    return hasher.hexdigest()
+    hashers = [hash_func() for hash_func in hash_funcs]
+
+    buffer = getattr(_thread_buffers, "buffer", None)
+    if buffer is None or len(buffer) != buffer_size:
+        buffer = _thread_buffers.buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as file:
+        while True:
+            size = file.readinto(buffer)
+            if not size:
+                break
+            for hasher in hashers:
+                hasher.update(view[:size])  # hashlib releases the GIL on large updates
+    return {algorithm: hasher.hexdigest() for algorithm, hasher in zip(algorithms, hashers)}
+
+
+class HashCache:
+    """SQLite cache of file digests keyed by (path, size, mtime, inode), to skip unchanged files."""
+
+    def __init__(self, cache_path: str):
+        self.connection = sqlite3.connect(cache_path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS hashes (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+            "inode INTEGER, digests TEXT)"
+        )
+
+    def get(self, path: str, stat: os.stat_result, algorithms: Sequence[str]) -> Optional[Dict[str, str]]:
+        """Return the cached digests if the file is unchanged and has all the algorithms."""
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, inode, digests FROM hashes WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None or tuple(row[:3]) != (stat.st_size, stat.st_mtime_ns, stat.st_ino):
+            return None
+        digests = json.loads(row[3])
+        if not all(algorithm in digests for algorithm in algorithms):
+            return None
+        return {algorithm: digests[algorithm] for algorithm in algorithms}
+
+    def put(self, path: str, stat: os.stat_result, digests: Dict[str, str]) -> None:
+        """Store the digests of a file along with the metadata they are valid for."""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?)",
+            (path, stat.st_size, stat.st_mtime_ns, stat.st_ino, json.dumps(digests)),
+        )
+
+    def close(self) -> None:
+        """Commit pending entries and close the database."""
+        self.connection.commit()
+        self.connection.close()
+
+
+def iter_files(root: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """Walk a directory tree with os.scandir and yield (path, stat) for every regular file."""
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue  # Unreadable directory
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+
+
+def _iter_hashed_files(root: str, algorithms: Sequence[str], workers: Optional[int],
+                       cache_path: Optional[str]) -> Iterator[Tuple[str, os.stat_result, Dict[str, str]]]:
+    """Hash every file of a tree concurrently, yielding (path, stat, digests) from a single walk."""
+    workers = workers or min(32, (os.cpu_count() or 1) * 2)
+    cache = HashCache(cache_path) if cache_path else None
+    in_flight: List[Tuple[str, os.stat_result, Future]] = []
+
+    def finish(entry: Tuple[str, os.stat_result, Future]) -> Optional[Tuple[str, os.stat_result, Dict[str, str]]]:
+        path, stat, future = entry
+        try:
+            digests = future.result()
+        except OSError:
+            return None
+        if cache is not None:
+            cache.put(path, stat, digests)
+        return path, stat, digests
+
+    try:
+        with ThreadPoolExecutor(workers) as pool:
+            for path, stat in iter_files(root):
+                cached = cache.get(path, stat, algorithms) if cache is not None else None
+                if cached is not None:
+                    yield path, stat, cached
+                    continue
+                in_flight.append((path, stat, pool.submit(hash_file, path, algorithms)))
+                if len(in_flight) >= workers * 4:
+                    result = finish(in_flight.pop(0))
+                    if result is not None:
+                        yield result
+            while in_flight:
+                result = finish(in_flight.pop(0))
+                if result is not None:
+                    yield result
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def iter_hash_tree(root: str, algorithms: Sequence[str] = ("sha256",), workers: Optional[int] = None,
+                   cache_path: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """Hash every file of a tree concurrently in a thread pool, yielding (path, digests).
+
+    Files whose (path, size, mtime, inode) match the cache are not read again. At most a few
+    files per worker are in flight, so memory stays flat on trees with millions of files.
+    Unreadable files are skipped.
+    """
+    for path, _, digests in _iter_hashed_files(root, algorithms, workers, cache_path):
+        yield path, digests
+
+
+def hash_tree(root: str, algorithms: Sequence[str] = ("sha256",), workers: Optional[int] = None,
+              cache_path: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+    """Hash every file of a tree and return {path: {algorithm: hexdigest}}."""
+    return dict(iter_hash_tree(root, algorithms, workers, cache_path))
+
+
+class IntegrityReport(NamedTuple):
+    """Differences between a tree and its baseline manifest."""
+    added: List[str]
+    removed: List[str]
+    modified: List[str]
+    rehashed: int
+    sampled: int
+
+
+def _try_hash(path: str, algorithm: str) -> Optional[str]:
+    """Hash a file, returning None if it vanished or cannot be read."""
+    try:
+        return hash_file(path, (algorithm,))[algorithm]
+    except OSError:
+        return None
+
+
+def _open_manifest(manifest_path: str) -> sqlite3.Connection:
+    """Open (creating if needed) a baseline manifest database."""
+    connection = sqlite3.connect(manifest_path)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+        "inode INTEGER, digest TEXT)"
+    )
+    connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    return connection
+
+
+def create_baseline(root: str, manifest_path: str, algorithm: str = "sha256",
+                    workers: Optional[int] = None) -> int:
+    """Hash every file of a tree into a SQLite baseline manifest and return the file count."""
+    connection = _open_manifest(manifest_path)
+    try:
+        connection.execute("DELETE FROM files")
+        connection.execute("INSERT OR REPLACE INTO meta VALUES ('algorithm', ?)", (algorithm,))
+        # One walk: each row is written with the stat the file was hashed under
+        rows = (
+            (path, stat.st_size, stat.st_mtime_ns, stat.st_ino, digests[algorithm])
+            for path, stat, digests in _iter_hashed_files(root, (algorithm,), workers, None)
+        )
+        connection.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?)", rows)
+        connection.commit()
+        return connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def check_integrity(root: str, manifest_path: str, verify_sample: float = 0.0, update: bool = False,
+                    workers: Optional[int] = None) -> IntegrityReport:
+    """Diff a tree against its baseline, re-hashing only files whose stat metadata changed.
+
+    A random `verify_sample` share (0 to 1) of the unchanged files is re-hashed as well, to
+    catch content changes that kept size and mtime. With `update`, the manifest is moved to
+    the current state of the tree.
+    """
+    connection = _open_manifest(manifest_path)
+    try:
+        row = connection.execute("SELECT value FROM meta WHERE key = 'algorithm'").fetchone()
+        algorithm = row[0] if row else "sha256"
+        baseline = {
+            path: (size, mtime_ns, inode, digest)
+            for path, size, mtime_ns, inode, digest in connection.execute("SELECT * FROM files")
+        }
+
+        added: List[str] = []
+        changed: List[str] = []
+        sampled: List[str] = []
+        current: Dict[str, os.stat_result] = {}
+        for path, stat in iter_files(root):
+            current[path] = stat
+            known = baseline.get(path)
+            if known is None:
+                added.append(path)
+            elif known[:3] != (stat.st_size, stat.st_mtime_ns, stat.st_ino):
+                changed.append(path)
+            elif verify_sample and random.random() < verify_sample:
+                sampled.append(path)
+
+        to_hash = added + changed + sampled
+        with ThreadPoolExecutor(workers or min(32, (os.cpu_count() or 1) * 2)) as pool:
+            digests = dict(zip(to_hash, pool.map(_try_hash, to_hash, [algorithm] * len(to_hash))))
+        # A file deleted between the walk and its hash is gone, not modified; one that still
+        # exists but cannot be read is reported as modified, since it cannot be verified
+        vanished = {path for path, digest in digests.items() if digest is None and not os.path.lexists(path)}
+        removed = sorted(path for path in baseline if path not in current or path in vanished)
+        modified = sorted(path for path in changed + sampled
+                          if path not in vanished and digests[path] != baseline[path][3])
+        hashed = len(added) + len(changed)
+        added = [path for path in added if path not in vanished]
+
+        if update:
+            connection.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in removed))
+            connection.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                ((path, current[path].st_size, current[path].st_mtime_ns, current[path].st_ino, digest)
+                 for path, digest in digests.items() if digest is not None),
+            )
+            connection.commit()
+        return IntegrityReport(sorted(added), removed, modified, hashed, len(sampled))
+    finally:
+        connection.close()
 
 # 2. Open Ports Scanner
 
+@profiled()
 def scan_ports(host: str, ports: List[int]) -> List[int]:
     """Scan a list of ports on a target host and return the open ones."""
     open_ports = []
@@ -32,8 +283,243 @@ def scan_ports(host: str, ports: List[int]) -> List[int]:
             s.settimeout(1)
             if s.connect_ex((host, port)) == 0:
                 open_ports.append(port)
+    count("scan_ports.probes", len(ports))
     return open_ports
 
+
+class ScanResult(NamedTuple):
+    """Outcome of probing one port; rtt is None when the probe timed out."""
+    host: str
+    port: int
+    is_open: bool
+    rtt: Optional[float]
+
+
+class _HostState:
+    """Per-host concurrency limit, pacing and smoothed RTT for adaptive timeouts."""
+
+    def __init__(self, limit: int, rate: Optional[float], timeout: float, pending: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.pending = pending  # Probes left; the state is dropped when it reaches zero
+        self.interval = 1 / rate if rate else 0.0
+        self.next_slot = 0.0
+        self.srtt: Optional[float] = None
+        self.rttvar = 0.0
+        self.max_timeout = timeout
+
+    def timeout(self, min_timeout: float) -> float:
+        """Return a TCP-style retransmission timeout (srtt + 4 * rttvar), clamped."""
+        if self.srtt is None:
+            return self.max_timeout
+        return max(min_timeout, min(self.max_timeout, self.srtt + 4 * self.rttvar))
+
+    def observe(self, rtt: float) -> None:
+        """Fold an RTT sample into the smoothed estimate (RFC 6298 gains)."""
+        if self.srtt is None:
+            self.srtt, self.rttvar = rtt, rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+
+    async def pace(self) -> None:
+        """Wait for this host's next connection slot under the rate limit."""
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _parse_network(target: str) -> Optional[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]]:
+    """Parse an IP address or CIDR range, or return None for a hostname."""
+    try:
+        return ipaddress.ip_network(target, strict=False)
+    except ValueError:
+        return None
+
+
+def _iter_targets(targets: Union[str, Iterable[str]]) -> Iterator[Tuple[str, bool]]:
+    """Yield (host, is_name) for every host of the targets, expanding CIDR ranges."""
+    if isinstance(targets, str):
+        targets = [targets]
+    for target in targets:
+        network = _parse_network(target)
+        if network is None:
+            yield target, True  # A hostname
+            continue
+        if network.num_addresses == 1:
+            yield str(network.network_address), False
+        else:
+            yield from ((str(address), False) for address in network.hosts())
+
+
+def expand_targets(targets: Union[str, Iterable[str]]) -> List[str]:
+    """Expand hostnames, IP addresses and CIDR ranges into a list of hosts."""
+    return [host for host, _ in _iter_targets(targets)]
+
+
+def _is_host_of(network: Union[ipaddress.IPv4Network, ipaddress.IPv6Network],
+                address: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> bool:
+    """Tell whether network.hosts() yields the address, without walking the range."""
+    if address.version != network.version or address not in network:
+        return False
+    if network.num_addresses <= 2:
+        return True
+    return address != network.network_address and (network.version == 6 or address != network.broadcast_address)
+
+
+def _iter_scan_hosts(targets: List[str], addresses: Dict[str, str]) -> Iterator[str]:
+    """Lazily yield every distinct host of the targets once, with hostnames already resolved.
+
+    Single addresses come first; a range host is skipped when a single target or an earlier
+    range already covers it, so memory grows with the number of targets, not of hosts.
+    """
+    singles: Dict[str, None] = {}
+    ranges = []
+    for target in targets:
+        network = _parse_network(target)
+        if network is None:
+            singles[addresses[target]] = None
+        elif network.num_addresses == 1:
+            singles[str(network.network_address)] = None
+        else:
+            ranges.append(network)
+    yield from singles
+    for index, network in enumerate(ranges):
+        earlier = ranges[:index]
+        for address in network.hosts():
+            host = str(address)
+            if host not in singles and not any(_is_host_of(previous, address) for previous in earlier):
+                yield host
+
+
+async def _resolve(name: str) -> str:
+    """Resolve a hostname to its first address, raising socket.gaierror like scan_ports."""
+    address_info = await asyncio.get_running_loop().getaddrinfo(name, None, type=socket.SOCK_STREAM)
+    return address_info[0][4][0]
+
+
+async def _probe(host: str, port: int, timeout: float) -> ScanResult:
+    """Try one non-blocking TCP connection and time the answer."""
+    loop = asyncio.get_running_loop()
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.setblocking(False)
+        start = loop.time()
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (host, port)), timeout)
+        except ConnectionRefusedError:
+            # A reset still measures the round trip to the host
+            return ScanResult(host, port, False, loop.time() - start)
+        except (asyncio.TimeoutError, OSError):
+            return ScanResult(host, port, False, None)
+        return ScanResult(host, port, True, loop.time() - start)
+
+
+async def iter_scan(targets: Union[str, Iterable[str]], ports: Iterable[int], concurrency: int = 500,
+                    per_host_limit: int = 100, per_host_rate: Optional[float] = None,
+                    timeout: float = 1.0, min_timeout: float = 0.05) -> AsyncIterator[ScanResult]:
+    """Scan ports on hosts and CIDR ranges concurrently, yielding results as they arrive.
+
+    At most `concurrency` connections are in flight overall and `per_host_limit` per host,
+    optionally paced to `per_host_rate` connections per second. Each host's timeout adapts
+    to its observed RTT, between `min_timeout` and `timeout`.
+
+    Hosts are expanded lazily, `concurrency` at a time, and a host's state lives only while
+    its ports are being probed, so scanning a large CIDR range needs no per-host memory up
+    front. A hostname that does not resolve raises socket.gaierror, like scan_ports.
+    """
+    ports = list(ports)
+    invalid = [port for port in ports if not 0 <= port <= 65535]
+    if invalid:
+        raise ValueError(f"Ports must be between 0 and 65535, got {invalid[:5]}.")
+    targets = [targets] if isinstance(targets, str) else list(targets)
+    # Resolve names once and concurrently, so every probe connects to a literal address;
+    # addresses (including every host of a CIDR range) need no lookup
+    names = list(dict.fromkeys(target for target in targets if _parse_network(target) is None))
+    addresses = dict(zip(names, await asyncio.gather(*map(_resolve, names))))
+    hosts = _iter_scan_hosts(targets, addresses)
+    window_size = max(1, concurrency)
+    states: Dict[str, _HostState] = {}
+
+    def iter_probes() -> Iterator[Tuple[str, int]]:
+        # Interleave the hosts of a window so a range scan spreads its load instead of
+        # hammering one host at a time; workers pull probes lazily, so the next window
+        # starts while the last probes of the previous one are still in flight
+        while True:
+            window = list(islice(hosts, window_size))
+            if not window:
+                return
+            for port in ports:
+                for host in window:
+                    yield host, port
+
+    probes = iter_probes()
+    results: asyncio.Queue = asyncio.Queue()
+    finished = object()
+
+    async def worker() -> None:
+        try:
+            for host, port in probes:
+                state = states.get(host)
+                if state is None:
+                    state = states[host] = _HostState(per_host_limit, per_host_rate, timeout, len(ports))
+                async with state.semaphore:
+                    await state.pace()
+                    result = await _probe(host, port, state.timeout(min_timeout))
+                if result.rtt is not None:
+                    state.observe(result.rtt)
+                state.pending -= 1
+                if not state.pending:
+                    del states[host]
+                await results.put(result)
+        except Exception as error:
+            # Hand the error to the consumer, which re-raises it like scan_ports would
+            results.put_nowait(error)
+        finally:
+            # Always report completion, or the consumer would wait on this worker forever
+            results.put_nowait(finished)
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    try:
+        remaining = len(workers)
+        while remaining:
+            result = await results.get()
+            if result is finished:
+                remaining -= 1
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def scan_ports_concurrent(host: str, ports: List[int], concurrency: int = 500, timeout: float = 1.0) -> List[int]:
+    """Concurrent drop-in for scan_ports: return the open ports of a host, sorted."""
+
+    async def collect() -> List[int]:
+        return sorted([result.port async for result in iter_scan(host, ports, concurrency, timeout=timeout)
+                       if result.is_open])
+
+    return asyncio.run(collect())
+
+
+def benchmark_port_scan(host: str = "127.0.0.1", ports: Optional[List[int]] = None) -> Dict[str, float]:
+    """Compare the ports/sec of scan_ports and scan_ports_concurrent on the same ports."""
+    ports = ports or list(range(20000, 22000))
+    results = {}
+    for scanner in (scan_ports, scan_ports_concurrent):
+        start = time.perf_counter()
+        scanner(host, ports)
+        results[scanner.__name__] = len(ports) / (time.perf_counter() - start)
+    return results
+
 # 3. Check Public IP
 
 def get_public_ip() -> str:
@@ -46,22 +532,100 @@ def get_public_ip() -> str:
 
 # 4. Password Generator
 
+PASSWORD_CHARACTERS = string.ascii_letters + string.digits + "!@#$%^&*()"
+# Character classes required by analyze_password_strength in Regular_expressions
+STRONG_PASSWORD_CLASSES = (string.ascii_uppercase, string.ascii_lowercase, string.digits, "@$!%*?&")
+ENTROPY_OVERDRAW = 1.1
+
+
+def _alphabet_table(alphabet: str) -> Tuple[bytes, bytes]:
+    """Build a bytes.translate table mapping random bytes onto the alphabet without modulo bias.
+
+    Bytes below the largest multiple of len(alphabet) map to alphabet[byte % len(alphabet)];
+    the bytes above it are returned as the deletion set, i.e. rejected.
+    """
+    size = len(alphabet)
+    if not 0 < size <= 256 or not alphabet.isascii():
+        raise ValueError("Alphabet must hold between 1 and 256 ASCII characters.")
+    limit = 256 - 256 % size
+    table = bytes(ord(alphabet[byte % size]) if byte < limit else 0 for byte in range(256))
+    return table, bytes(range(limit, 256))
+
+
+def random_characters(alphabet: str, amount: int) -> str:
+    """Draw `amount` uniformly distributed characters of the alphabet from os.urandom in bulk."""
+    table, rejected = _alphabet_table(alphabet)
+    acceptance = (256 - len(rejected)) / 256
+    chunks, drawn = [], 0
+    while drawn < amount:
+        # translate() maps and rejects a whole block in C; the loop only reruns on a short block
+        chunk = os.urandom(int((amount - drawn) / acceptance * ENTROPY_OVERDRAW) + 16).translate(table, rejected)
+        chunks.append(chunk)
+        drawn += len(chunk)
+    return b"".join(chunks)[:amount].decode("ascii")
+
+
+def generate_passwords(amount: int, length: int = 16, alphabet: Optional[str] = None,
+                       required: Sequence[str] = STRONG_PASSWORD_CLASSES) -> List[str]:
+    """Generate `amount` passwords from the system CSPRNG, each holding a character of every required class.
+
+    One required character per class is drawn from that class and inserted at a random position
+    among characters drawn from the whole alphabet (by default the union of the classes), so
+    every password satisfies the policy on the first draw. With the default classes and a
+    length of at least 8, the passwords pass analyze_password_strength.
+    """
+    alphabet = alphabet or "".join(required) or PASSWORD_CHARACTERS
+    if length < len(required):
+        raise ValueError(f"Length must be at least {len(required)} (the required classes).")
+    free = length - len(required)
+    fill = random_characters(alphabet, amount * free)
+    picks = [random_characters(characters, amount) for characters in required]
+    passwords = []
+    for index in range(amount):
+        password = fill[index * free:(index + 1) * free]
+        for number, pick in enumerate(picks):
+            # The n-th required character goes to a uniform position among free + n + 1 slots
+            position = secrets.randbelow(free + number + 1)
+            password = password[:position] + pick[index] + password[position:]
+        passwords.append(password)
+    return passwords
+
+
 def generate_password(length: int = 16) -> str:
     """Generate a random password with a given length."""
-    characters = string.ascii_letters + string.digits + "!@#$%^&*()"
-    return "".join(random.choice(characters) for _ in range(length))
+    return generate_passwords(1, length, PASSWORD_CHARACTERS, required=())[0]
+
+
+def benchmark_password_generation(amount: int = 100_000, length: int = 16) -> Dict[str, float]:
+    """Compare the passwords/sec of per-character choice and generate_passwords."""
+    results = {}
+    for name, chooser in (("random.choice", random.choice), ("secrets.choice", secrets.choice)):
+        start = time.perf_counter()
+        for _ in range(amount):
+            "".join(chooser(PASSWORD_CHARACTERS) for _ in range(length))
+        results[name] = amount / (time.perf_counter() - start)
+    start = time.perf_counter()
+    generate_passwords(amount, length)
+    results["generate_passwords"] = amount / (time.perf_counter() - start)
+    return results
 
 
 # Example Usage
 if __name__ == "__main__":
     # Hash Generator Example
     # print(generate_hash("example.txt"))
+    # print(hash_tree(".", ("sha256", "md5"), cache_path="hash_cache.db"))
+    # create_baseline(".", "baseline.db"); print(check_integrity(".", "baseline.db", verify_sample=0.01))
     
     # Port Scanner Example
     # print(scan_ports("127.0.0.1", [22, 80, 443]))
+    # print(scan_ports_concurrent("127.0.0.1", list(range(1, 1025))))
+    # print(benchmark_port_scan())
     
     # Public IP Example
     print("Public IP:", get_public_ip())
     
     # Password Generator Example
     print("Generated Password:", generate_password())
+    # print(generate_passwords(5, 12))
+    # print(benchmark_password_generation())
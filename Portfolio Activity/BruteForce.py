@@ -1,8 +1,22 @@
+import os
+import heapq
 import random
-import nltk
-from nltk.corpus import words
+import pickle
+import itertools
+import multiprocessing
 import time
-from typing import Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple, Optional
+
+try:
+    from profiling_hooks import count, profiled
+except ImportError:
+    # No-op fallbacks when Benchmarks/ is not on the path; see the profiling_hooks docstring
+    def profiled(name=None):
+        return lambda function: function
+
+    def count(name, amount=1):
+        pass
 
 
 def generate_key() -> int:
@@ -14,6 +28,24 @@ def generate_key() -> int:
     return random.randint(0, 65535)
 
 
+def xor_with_key(data: bytes, key_bytes: bytes) -> bytes:
+    """XOR data with a repeated key in one wide integer operation.
+
+    Args:
+        data (bytes): The bytes to XOR.
+        key_bytes (bytes): The key, repeated to the length of the data.
+
+    Returns:
+        bytes: The XORed bytes.
+    """
+    if not data:
+        return b""
+    # Repeat the key to match the length of the data
+    key_repeated = (key_bytes * (len(data) // len(key_bytes) + 1))[:len(data)]
+    # A single big-integer XOR replaces the per-byte Python loop
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(key_repeated, 'big')).to_bytes(len(data), 'big')
+
+
 def simple_cryptography(message: str, key: int) -> bytes:
     """Encrypt a message using XOR with a repeated 16-bit key.
 
@@ -24,14 +56,10 @@ def simple_cryptography(message: str, key: int) -> bytes:
     Returns:
         bytes: The encrypted message as bytes.
     """
-    # Convert the key to 2 bytes (16 bits)
-    key_bytes = key.to_bytes(2, 'big')
     # Encode the message to bytes using UTF-8
     message_bytes = message.encode('utf-8')
-    # Repeat the key to match the length of the message
-    key_repeated = (key_bytes * (len(message_bytes) // len(key_bytes) + 1))[:len(message_bytes)]
-    # Perform XOR between the message and the repeated key
-    ciphertext = bytes([m ^ k for m, k in zip(message_bytes, key_repeated)])
+    # XOR the message with the repeated 2-byte (16-bit) key
+    ciphertext = xor_with_key(message_bytes, key.to_bytes(2, 'big'))
     # Return the encrypted message as bytes
     return ciphertext
 
@@ -46,12 +74,8 @@ def simple_decrypt(ciphertext: bytes, key: int) -> str:
     Returns:
         str: The decrypted message as a string.
     """
-    # Convert the key to 2 bytes (16 bits)
-    key_bytes = key.to_bytes(2, 'big')
-    # Repeat the key to match the length of the ciphertext
-    key_repeated = (key_bytes * (len(ciphertext) // len(key_bytes) + 1))[:len(ciphertext)]
-    # Perform XOR between the ciphertext and the repeated key
-    message_bytes = bytes([c ^ k for c, k in zip(ciphertext, key_repeated)])
+    # XOR the ciphertext with the repeated 2-byte (16-bit) key
+    message_bytes = xor_with_key(ciphertext, key.to_bytes(2, 'big'))
     
     # Attempt to decode the message to a string using UTF-8
     try:
@@ -60,11 +84,106 @@ def simple_decrypt(ciphertext: bytes, key: int) -> str:
         return ""  # Return an empty string if decoding fails
 
 
-# Download the words corpus from NLTK
-nltk.download('words')
+# Compact on-disk copy of the dictionary, so later runs skip NLTK entirely
+DICTIONARY_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "googlescripts", "english_words.pickle")
+# Optional plain-text word list (one word per line) for fully offline use
+DICTIONARY_PATH_VARIABLE = "ENGLISH_WORDS_PATH"
 
-# Create a set of English words for quick lookup
-word_list = set(words.words())
+_dictionary: Optional[Dict[str, frozenset]] = None
+
+
+def _load_source_words() -> List[str]:
+    """Read the English words from a local word file, or from the NLTK corpus.
+
+    Returns:
+        list: The words, as found in the source.
+    """
+    local_path = os.environ.get(DICTIONARY_PATH_VARIABLE)
+    if local_path:
+        with open(local_path, "r") as file:
+            return [line.strip() for line in file if line.strip()]
+
+    # Imported here so that importing this module never touches NLTK or the network
+    import nltk
+    from nltk.corpus import words
+    try:
+        return words.words()
+    except LookupError:
+        # Download the words corpus from NLTK (only when it is not installed yet)
+        nltk.download('words', quiet=True)
+        return words.words()
+
+
+def _source_signature() -> tuple:
+    """Identify the current word source, so a cache built from another source is not reused.
+
+    Returns:
+        tuple: (path, modification time, size) of the local word file, or ("nltk",).
+    """
+    local_path = os.environ.get(DICTIONARY_PATH_VARIABLE)
+    if local_path:
+        stat = os.stat(local_path)
+        return os.path.abspath(local_path), stat.st_mtime_ns, stat.st_size
+    return ("nltk",)
+
+
+def get_dictionary(cache_path: str = DICTIONARY_CACHE_PATH) -> Dict[str, frozenset]:
+    """Load the English dictionary once per process, building the on-disk cache if needed.
+
+    The cache records the word source it was built from (ENGLISH_WORDS_PATH with its
+    modification time and size, or NLTK) and is rebuilt when that source changes. A
+    cache that cannot be read or written (corrupt file, read-only home) is skipped and
+    the dictionary is kept in memory only.
+
+    Args:
+        cache_path (str): Where the pickled dictionary is read from and written to.
+
+    Returns:
+        dict: "words" (frozenset of lowercase words) and "source", the signature of the
+        word source.
+    """
+    global _dictionary
+    if _dictionary is not None:
+        return _dictionary
+
+    source = _source_signature()
+    try:
+        with open(cache_path, "rb") as file:
+            cached = pickle.load(file)
+        # Caches from an older layout have no "source" and are rebuilt
+        if (isinstance(cached, dict) and cached.get("source") == source
+                and isinstance(cached.get("words"), frozenset)):
+            _dictionary = cached
+            return _dictionary
+    except Exception:
+        pass  # Missing, unreadable, truncated or foreign cache: rebuild it
+
+    # Create a set of English words for quick lookup
+    english_words = frozenset(word.lower() for word in _load_source_words())
+    _dictionary = {"words": english_words, "source": source}
+
+    temp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, "wb") as file:
+            pickle.dump(_dictionary, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # The cache is only a speed-up; the words are already loaded
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    return _dictionary
+
+
+def get_word_list() -> frozenset:
+    """Return the set of lowercase English words, loading it on first use.
+
+    Returns:
+        frozenset: The English words.
+    """
+    return get_dictionary()["words"]
 
 
 def is_english_word(text: str) -> bool:
@@ -82,12 +201,14 @@ def is_english_word(text: str) -> bool:
     if not words_in_text or not text.isprintable():  # Ensure the text is readable
         return False # Return False if the text is empty or contains non-printable characters
     # Calculate the ratio of valid English words in the text
+    word_list = get_word_list()
     ratio = sum(1 for word in words_in_text if word.lower() in word_list) / len(words_in_text)
     
     return ratio > 0.75  # Require 75% of words to be valid English
 
 
 
+@profiled()
 def brute_force_attack(ciphertext: bytes) ->  Tuple[Optional[int], Optional[str], int, float]:
     """
     Perform a brute-force attack to decrypt a message encrypted with a simple XOR cipher.
@@ -124,6 +245,7 @@ def brute_force_attack(ciphertext: bytes) ->  Tuple[Optional[int], Optional[str]
             print(f"Total Attempts: {attempts}")
             print(f"Time Taken: {elapsed_time:.4f} seconds")  
 
+            count("brute_force_attack.attempts", attempts)
             return key, decrypted, attempts, elapsed_time  # Return the successful result
 
     # If no valid key is found, compute elapsed time and return failure message
@@ -132,25 +254,384 @@ def brute_force_attack(ciphertext: bytes) ->  Tuple[Optional[int], Optional[str]
     print(f"Total Attempts: {attempts}") 
     print(f"Time Taken: {elapsed_time:.4f} seconds") 
 
+    count("brute_force_attack.attempts", attempts)
     return None, None, attempts, elapsed_time  # Return failure case (no valid key found)
 
 
 
+# For each key byte value, the ciphertext bytes that decrypt to printable ASCII (0x20-0x7E)
+PRINTABLE_UNDER_KEY_BYTE: List[bytes] = [
+    bytes(b for b in range(256) if 0x20 <= b ^ k <= 0x7E) for k in range(256)
+]
+
+
+def printable_key_bytes(stream: bytes) -> List[int]:
+    """Find the key byte values that decrypt every byte of a stream to printable ASCII.
+
+    Args:
+        stream (bytes): The ciphertext bytes encrypted with the same key byte.
+
+    Returns:
+        list: The key byte values (0-255) that keep the stream printable.
+    """
+    # translate() deletes the bytes that become printable; nothing left means all of them do
+    return [k for k in range(256) if not stream.translate(None, PRINTABLE_UNDER_KEY_BYTE[k])]
+
+
+def key_byte_candidates(ciphertext: bytes, key_size: int = 2) -> List[List[int]]:
+    """Prune each byte of a repeating key independently to its printable-ASCII values.
+
+    Byte i of the key only encrypts the ciphertext bytes at positions i, i + key_size, ...
+
+    Args:
+        ciphertext (bytes): The encrypted message as bytes.
+        key_size (int): The key length in bytes.
+
+    Returns:
+        list: For each key byte position (most significant first), the surviving byte values.
+    """
+    return [printable_key_bytes(ciphertext[position::key_size]) for position in range(key_size)]
+
+
+def candidate_keys(ciphertext: bytes) -> List[int]:
+    """List the 16-bit keys under which the whole ciphertext decrypts to printable ASCII.
+
+    Even-position bytes are encrypted with the high key byte and odd-position bytes with
+    the low one, so each half is pruned independently (2 x 256 checks, not 65,536).
+
+    Args:
+        ciphertext (bytes): The encrypted message as bytes.
+
+    Returns:
+        list: The surviving keys in ascending order.
+    """
+    high_bytes, low_bytes = key_byte_candidates(ciphertext, 2)
+    return [(high << 8) | low for high in high_bytes for low in low_bytes]
+
+
+def fast_brute_force_attack(ciphertext: bytes) -> Tuple[Optional[int], Optional[str], int, float]:
+    """
+    Brute-force the 16-bit XOR key by pruning the key space to printable-ASCII candidates
+    first, so only a handful of keys ever reach UTF-8 decoding and the dictionary check.
+
+    Unlike brute_force_attack, plaintexts with non-ASCII characters are not found.
+
+    Args:
+        ciphertext (bytes): The encrypted message as a byte sequence.
+
+    Returns:
+        tuple: Same as brute_force_attack; attempts counts the candidate keys actually
+        decrypted, not the pruned part of the key space.
+    """
+    attempts: int = 0
+    start_time: float = time.perf_counter()
+
+    for key in candidate_keys(ciphertext):
+        attempts += 1
+        decrypted: str = simple_decrypt(ciphertext, key)
+        if decrypted and is_english_word(decrypted):
+            elapsed_time: float = time.perf_counter() - start_time
+            print("\n===== Fast Brute-Force Attack Successful =====")
+            print(f"Key Found: {key} (Hex: {key.to_bytes(2, 'big').hex()})")
+            print(f"Decrypted Message: {decrypted}")
+            print(f"Total Attempts: {attempts}")
+            print(f"Time Taken: {elapsed_time:.4f} seconds")
+            return key, decrypted, attempts, elapsed_time
+
+    elapsed_time: float = time.perf_counter() - start_time
+    print("\n===== Fast Brute-Force Attack Failed =====")
+    print(f"Total Attempts: {attempts}")
+    print(f"Time Taken: {elapsed_time:.4f} seconds")
+    return None, None, attempts, elapsed_time
+
+
+def english_score(text: str) -> float:
+    """Score how English a text looks, for ranking candidate plaintexts.
+
+    Args:
+        text (str): The text to score.
+
+    Returns:
+        float: The share of dictionary words (0 to 1), plus up to 0.1 for the share of
+        letters and spaces, which breaks ties between texts with equal word ratios.
+    """
+    words_in_text = text.split()
+    if not words_in_text:
+        return 0.0
+    word_list = get_word_list()
+    ratio = sum(1 for word in words_in_text if word.lower() in word_list) / len(words_in_text)
+    letters = sum(1 for char in text if char.isalpha() or char == " ") / len(text)
+    return ratio + 0.1 * letters
+
+
+# Shared with the pool workers through the initializer, so all of them see a stop request
+_stop_event = None
+
+
+def _init_search_worker(stop_event) -> None:
+    """Store the shared cancellation event in a pool worker."""
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _search_shard(ciphertext: bytes, key_size: int, first_byte: int, other_bytes: List[List[int]],
+                  find_all: bool, top: int) -> Tuple[int, int, float, List[Tuple[float, int, str]]]:
+    """Test every pruned key starting with a given byte (runs in a pool worker).
+
+    Args:
+        ciphertext (bytes): The encrypted message as bytes.
+        key_size (int): The key length in bytes.
+        first_byte (int): The most significant key byte of this shard.
+        other_bytes (list): Candidate values for the remaining key bytes.
+        find_all (bool): Keep scoring after the first English plaintext instead of stopping.
+        top (int): With find_all, how many of the best-scoring keys to keep.
+
+    Returns:
+        tuple: (worker pid, keys tested, seconds taken, [(score, key, plaintext), ...]).
+    """
+    start_time = time.perf_counter()
+    tested = 0
+    found = []
+    for rest in itertools.product(*other_bytes):
+        if tested % 1024 == 0 and _stop_event is not None and _stop_event.is_set():
+            break
+        tested += 1
+        key_bytes = bytes((first_byte, *rest))
+        decrypted = xor_with_key(ciphertext, key_bytes).decode('ascii')
+        if find_all:
+            score = english_score(decrypted)
+            if score > 0.1 and top > 0:
+                # A min-heap of the best `top` keys bounds what is sent back to the parent
+                candidate = (score, int.from_bytes(key_bytes, 'big'), decrypted)
+                if len(found) < top:
+                    heapq.heappush(found, candidate)
+                elif candidate > found[0]:
+                    heapq.heapreplace(found, candidate)
+        elif is_english_word(decrypted):
+            found.append((english_score(decrypted), int.from_bytes(key_bytes, 'big'), decrypted))
+            if _stop_event is not None:
+                _stop_event.set()
+            break
+    return os.getpid(), tested, time.perf_counter() - start_time, found
+
+
+def parallel_brute_force(ciphertext: bytes, key_size: int = 2, workers: Optional[int] = None,
+                         find_all: bool = False, top: int = 10) -> Dict[str, object]:
+    """Search a repeating XOR key space in parallel across a process pool.
+
+    The key space is pruned per key byte to printable-ASCII values and sharded by the most
+    significant byte. In "first" mode every worker stops as soon as one finds an English
+    plaintext; with find_all, every surviving key is scored and the best ones are ranked.
+    Wider keys (key_size 3 or 4, i.e. 24/32-bit) are searched the same way.
+
+    Args:
+        ciphertext (bytes): The encrypted message as bytes.
+        key_size (int): The key length in bytes. Defaults to 2 (the 16-bit key of simple_cryptography).
+        workers (int): Number of worker processes. Defaults to the CPU count.
+        find_all (bool): Rank every plausible key instead of returning the first hit.
+        top (int): Number of ranked candidates to return with find_all.
+
+    Returns:
+        dict: With keys
+            - "key" (int | None) and "plaintext" (str | None): the first hit, or the best ranked key.
+            - "candidates" (list): (score, key, plaintext) tuples, best first.
+            - "keys_tested" (int): Keys decrypted across all workers.
+            - "elapsed" (float): Total time taken in seconds.
+            - "keys_per_second" (dict): Throughput of each worker process, by pid.
+    """
+    start_time = time.perf_counter()
+    first_bytes, *other_bytes = key_byte_candidates(ciphertext, key_size)
+    get_dictionary()  # Load before forking so every worker inherits it
+    stop_event = multiprocessing.Event()
+    candidates: List[Tuple[float, int, str]] = []
+    worker_stats: Dict[int, List[float]] = {}
+
+    with ProcessPoolExecutor(workers, initializer=_init_search_worker, initargs=(stop_event,)) as pool:
+        futures = [pool.submit(_search_shard, ciphertext, key_size, first_byte, other_bytes, find_all, top)
+                   for first_byte in first_bytes]
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            pid, tested, seconds, found = future.result()
+            stats = worker_stats.setdefault(pid, [0, 0.0])
+            stats[0] += tested
+            stats[1] += seconds
+            candidates.extend(found)
+            if found and not find_all:
+                stop_event.set()
+                for pending in futures:
+                    pending.cancel()
+
+    # Each shard sends at most `top` candidates, so the merge stays small
+    candidates = heapq.nlargest(top, candidates)
+    best = candidates[0] if candidates else (None, None, None)
+    return {
+        "key": best[1],
+        "plaintext": best[2],
+        "candidates": candidates,
+        "keys_tested": sum(int(stats[0]) for stats in worker_stats.values()),
+        "elapsed": time.perf_counter() - start_time,
+        "keys_per_second": {pid: stats[0] / stats[1] if stats[1] else 0.0
+                            for pid, stats in worker_stats.items()},
+    }
+
+
+# Relative frequency of characters in English text (space included), for frequency analysis
+ENGLISH_FREQUENCIES: Dict[str, float] = {
+    ' ': 0.1918, 'e': 0.1041, 't': 0.0729, 'a': 0.0651, 'o': 0.0596, 'n': 0.0564, 'i': 0.0558,
+    's': 0.0515, 'r': 0.0497, 'h': 0.0493, 'd': 0.0349, 'l': 0.0331, 'u': 0.0225, 'c': 0.0217,
+    'm': 0.0202, 'f': 0.0198, 'w': 0.0171, 'g': 0.0158, 'y': 0.0146, 'p': 0.0137, 'b': 0.0124,
+    'v': 0.0080, 'k': 0.0056, 'x': 0.0013, 'j': 0.0010, 'q': 0.0009, 'z': 0.0006,
+}
+# Weight of every byte value: uppercase letters count half, anything non-printable is penalized
+BYTE_WEIGHTS: List[float] = [
+    (ENGLISH_FREQUENCIES.get(chr(b), 0.0) or ENGLISH_FREQUENCIES.get(chr(b).lower(), 0.0) / 2)
+    if 0x20 <= b <= 0x7E else -0.05 for b in range(256)
+]
+# Average weight per character of typical English text, used to turn scores into confidences
+EXPECTED_ENGLISH_WEIGHT: float = sum(frequency ** 2 for frequency in ENGLISH_FREQUENCIES.values())
+
+
+def rank_key_bytes(stream: bytes) -> List[Tuple[float, int]]:
+    """Rank the 256 single-byte keys of a stream by English character frequency.
+
+    Args:
+        stream (bytes): The ciphertext bytes encrypted with the same key byte.
+
+    Returns:
+        list: (score, key byte) tuples, best first; the score is the mean byte weight.
+    """
+    if not stream:
+        return [(0.0, k) for k in range(256)]
+    # One histogram of the stream, then 256 weighted sums over its distinct bytes
+    histogram = [(byte, stream.count(byte)) for byte in set(stream)]
+    scores = [(sum(count * BYTE_WEIGHTS[byte ^ k] for byte, count in histogram) / len(stream), k)
+              for k in range(256)]
+    scores.sort(reverse=True)
+    return scores
+
+
+def hamming_distance(first: bytes, second: bytes) -> int:
+    """Count the differing bits between two equal-length byte strings.
+
+    Args:
+        first (bytes): The first byte string.
+        second (bytes): The second byte string.
+
+    Returns:
+        int: The number of differing bits.
+    """
+    return bin(int.from_bytes(first, 'big') ^ int.from_bytes(second, 'big')).count("1")
+
+
+def estimate_key_sizes(ciphertext: bytes, max_key_size: int = 40, top: int = 3) -> List[int]:
+    """Estimate the most likely repeating-key lengths from normalized Hamming distances.
+
+    Bytes encrypted with the same key byte differ like two English characters do, which
+    is fewer bits than random bytes, so comparing the ciphertext with itself shifted by
+    the right key size (or one of its multiples) gives the lowest distance per bit.
+
+    Args:
+        ciphertext (bytes): The encrypted message as bytes.
+        max_key_size (int): The longest key length to consider.
+        top (int): Number of key sizes to return.
+
+    Returns:
+        list: The likeliest key sizes, best first.
+    """
+    distances = {
+        key_size: hamming_distance(ciphertext[:-key_size], ciphertext[key_size:]) / (len(ciphertext) - key_size)
+        for key_size in range(1, min(max_key_size, len(ciphertext) // 2) + 1)
+    }
+    return sorted(distances, key=distances.get)[:top] or [1]
+
+
+def frequency_attack(ciphertext: bytes, key_size: Optional[int] = None, max_key_size: int = 40,
+                     top: int = 3, beam: int = 3) -> List[Tuple[float, bytes, int, str]]:
+    """Recover a repeating XOR key by single-byte frequency analysis of each key position.
+
+    Each key byte encrypts an independent stream of ciphertext bytes, so a 16-bit key
+    needs 2 x 256 scoring passes instead of 65,536 decrypt-and-dictionary checks, and
+    longer keys stay linear in their length. When the key size is unknown, the likeliest
+    sizes (and their divisors) are estimated with normalized Hamming distances. For short keys the `beam` best
+    bytes of every position are combined, which keeps short messages recoverable.
+
+    Args:
+        ciphertext (bytes): The encrypted message as bytes.
+        key_size (int): The key length in bytes, or None to estimate it (2 for simple_cryptography).
+        max_key_size (int): The longest key length tried when estimating.
+        top (int): Number of estimated key sizes to try.
+        beam (int): Number of best bytes per position combined when beam ** key_size <= 256.
+
+    Returns:
+        list: (confidence, key, key size, plaintext) tuples, best first. The key is the
+        repeating key as bytes, as used by xor_with_key (for a 2-byte key,
+        int.from_bytes(key, 'big') is the simple_decrypt key); confidence (0 to 1) averages
+        the dictionary-word ratio and the character-frequency fit relative to typical English text.
+    """
+    if not ciphertext:
+        return []
+    if key_size:
+        key_sizes = [key_size]
+    else:
+        # Estimates are often multiples of the real size, so their divisors are tried as well
+        estimates = estimate_key_sizes(ciphertext, max_key_size, top)
+        key_sizes = sorted({d for size in estimates for d in range(1, size + 1) if size % d == 0})
+    candidates: Dict[str, Tuple[float, bytes, int, str]] = {}
+    word_list = get_word_list()
+    for size in key_sizes:
+        width = beam if beam ** size <= 256 else 1
+        ranked = [[k for _, k in rank_key_bytes(ciphertext[position::size])[:width]] for position in range(size)]
+        for key_bytes in itertools.product(*ranked):
+            plaintext_bytes = xor_with_key(ciphertext, bytes(key_bytes))
+            weight = sum(BYTE_WEIGHTS[byte] for byte in plaintext_bytes) / max(len(plaintext_bytes), 1)
+            plaintext = plaintext_bytes.decode('utf-8', errors='replace')
+            words_in_text = plaintext.split()
+            ratio = sum(1 for word in words_in_text if word.lower() in word_list) / max(len(words_in_text), 1)
+            confidence = (ratio + max(0.0, min(1.0, weight / EXPECTED_ENGLISH_WEIGHT))) / 2
+            # Longer keys fit fewer bytes per position and overfit, so they need stronger evidence
+            confidence *= 1 - size / len(ciphertext)
+            # A multiple of the real key size yields the same plaintext: keep the shortest key
+            if plaintext not in candidates or size < candidates[plaintext][2]:
+                candidates[plaintext] = (confidence, bytes(key_bytes), size, plaintext)
+    return sorted(candidates.values(), key=lambda candidate: (-candidate[0], candidate[2]))[:max(top, 1) * 3]
+
+
+def benchmark_brute_force(ciphertext: bytes) -> dict:
+    """Compare the serial brute-force loop with the pruned and frequency attacks on the same ciphertext.
+
+    Args:
+        ciphertext (bytes): The encrypted message as bytes.
+
+    Returns:
+        dict: Seconds taken by each attack, keyed by function name.
+    """
+    start_time = time.perf_counter()
+    frequency_attack(ciphertext, key_size=2)
+    frequency_time = time.perf_counter() - start_time
+    return {
+        "brute_force_attack": brute_force_attack(ciphertext)[3],
+        "fast_brute_force_attack": fast_brute_force_attack(ciphertext)[3],
+        "frequency_attack": frequency_time,
+    }
+
+
 # Example usage
-message = "Hello world"
-key = generate_key()
-ciphertext = simple_cryptography(message, key)
-decrypted_text = simple_decrypt(ciphertext, key)
-
-# Display encryption details
-print("\n===== Encryption Details =====")
-print(f"Original Message: {message}")
-print(f"Generated Key (Hex): {key.to_bytes(2, 'big').hex()}")
-print(f"Ciphertext (Hex): {ciphertext.hex()}")
-
-# Display decryption result
-print("\n===== Decryption Test =====")
-print(f"Decrypted Text: {decrypted_text}")
-
-# Perform brute-force attack
-brute_force_attack(ciphertext)
+if __name__ == "__main__":
+    message = "Hello world"
+    key = generate_key()
+    ciphertext = simple_cryptography(message, key)
+    decrypted_text = simple_decrypt(ciphertext, key)
+
+    # Display encryption details
+    print("\n===== Encryption Details =====")
+    print(f"Original Message: {message}")
+    print(f"Generated Key (Hex): {key.to_bytes(2, 'big').hex()}")
+    print(f"Ciphertext (Hex): {ciphertext.hex()}")
+
+    # Display decryption result
+    print("\n===== Decryption Test =====")
+    print(f"Decrypted Text: {decrypted_text}")
+
+    # Compare the serial brute-force attack with the pruned and frequency-analysis ones
+    print(benchmark_brute_force(ciphertext))
@@ -4,44 +4,182 @@ It reads a file containing allowed IPs, removes the ones present in a remove lis
 
 Functions used:
 - open() with the with statement for safe file handling
-- .read() and .write() for reading and updating file contents
-- .split() to convert string data into a list
-- for loop to iterate through remove list
-- .remove() to delete specific IP addresses from the list
+- sets for constant-time lookups of the IPs to remove or add
+- a sorted interval index so removed CIDR blocks (e.g. 10.0.0.0/8) also remove the IPs they contain
+- a single pass over the allow list, written to a temporary file that atomically replaces the original
 
 """
 
-from typing import List
+import os
+import socket
+import tempfile
+from bisect import bisect_right
+from ipaddress import ip_network
+from typing import Dict, Iterable, List, Optional, Tuple
 
-def update_allow_list(allow_list_file: str, remove_list_file: str) -> None:
+try:
+    from profiling_hooks import count, profiled
+except ImportError:
+    # No-op fallbacks when Benchmarks/ is not on the path; see the profiling_hooks docstring
+    def profiled(name=None):
+        return lambda function: function
+
+    def count(name, amount=1):
+        pass
+
+Interval = Tuple[int, int, int]  # (IP version, first address, last address)
+
+
+def parse_entry(entry: str) -> Optional[Interval]:
+    """
+    Converts an allow list entry (single IP or CIDR block) into the address interval it covers.
+
+    :param entry: The entry, already stripped of whitespace.
+    :return: (version, first address, last address), or None if the entry is not an IP or a network.
+    """
+    try:
+        # Fast path for the common case of a plain address
+        if "/" not in entry:
+            if ":" in entry:
+                value = int.from_bytes(socket.inet_pton(socket.AF_INET6, entry), "big")
+                return 6, value, value
+            if entry.count(".") == 3:
+                value = int.from_bytes(socket.inet_pton(socket.AF_INET, entry), "big")
+                return 4, value, value
+            return None
+        network = ip_network(entry, strict=False)
+    except (OSError, ValueError):
+        return None
+    return network.version, int(network.network_address), int(network.broadcast_address)
+
+
+class IntervalIndex:
+    """Merged, sorted address intervals answering "is this range fully covered?" by binary search."""
+
+    def __init__(self, intervals: Iterable[Interval]):
+        """
+        :param intervals: (version, first address, last address) ranges to index.
+        """
+        merged: Dict[int, List[List[int]]] = {4: [], 6: []}
+        for version, start, end in sorted(intervals):
+            ranges = merged[version]
+            if ranges and start <= ranges[-1][1] + 1:
+                ranges[-1][1] = max(ranges[-1][1], end)
+            else:
+                ranges.append([start, end])
+        self._starts = {version: [start for start, _ in ranges] for version, ranges in merged.items()}
+        self._ends = {version: [end for _, end in ranges] for version, ranges in merged.items()}
+
+    def __bool__(self) -> bool:
+        return any(self._starts.values())
+
+    def covers(self, interval: Interval) -> bool:
+        """
+        Checks whether an address range lies entirely inside the indexed ranges.
+
+        :param interval: (version, first address, last address) to check.
+        :return: True if every address of the range is covered.
+        """
+        version, start, end = interval
+        position = bisect_right(self._starts[version], start) - 1
+        return position >= 0 and end <= self._ends[version][position]
+
+
+def _read_entries(file_path: str) -> List[str]:
+    """Streams a list file into its distinct stripped, non-empty entries, in file order."""
+    with open(file_path, "r") as file:
+        return list(dict.fromkeys(entry for entry in (line.strip() for line in file) if entry))
+
+
+def apply_allow_list_changes(allow_list_file: str, remove: Iterable[str] = (),
+                             add: Iterable[str] = ()) -> Dict[str, int]:
+    """
+    Removes and adds allow list entries in a single pass, keeping the original order.
+
+    An entry is removed when it equals a remove entry or when its address (or whole CIDR block)
+    falls inside a removed IP or CIDR block; every duplicate is removed. New entries are appended
+    unless an entry kept in the file already covers them. The updated list is written to a
+    temporary file that then atomically replaces the original, so it is never half-written.
+
+    :param allow_list_file: Path to the file containing the allow list.
+    :param remove: IPs or CIDR blocks to remove.
+    :param add: IPs or CIDR blocks to add.
+    :return: Dictionary with the number of "kept", "removed" and "added" entries.
+    """
+    remove_entries = {entry.strip() for entry in remove} - {""}
+    removed_ranges = IntervalIndex(filter(None, map(parse_entry, remove_entries)))
+    check_ranges = bool(removed_ranges)
+    pending = dict.fromkeys(entry for entry in (item.strip() for item in add) if entry)  # Ordered set
+    counts = {"kept": 0, "removed": 0, "added": 0}
+    # Kept entries that may cover a pending addition without matching it as a string: CIDR
+    # blocks, plus plain IPs when a CIDR block (e.g. "8.8.8.8/32") is being added
+    kept_ranges: List[Interval] = []
+    adds_network = any("/" in entry for entry in pending)
+
+    directory = os.path.dirname(os.path.abspath(allow_list_file))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".allow_list.", suffix=".tmp")
+    try:
+        with open(allow_list_file, "r") as source, os.fdopen(handle, "w") as target:
+            ends_with_newline = True
+            for line in source:
+                entry = line.strip()
+                if entry:
+                    if entry in remove_entries:
+                        counts["removed"] += 1
+                        continue
+                    tracked = pending and (adds_network or "/" in entry)
+                    interval = parse_entry(entry) if check_ranges or tracked else None
+                    if check_ranges and interval and removed_ranges.covers(interval):
+                        counts["removed"] += 1
+                        continue
+                    counts["kept"] += 1
+                    if pending:
+                        pending.pop(entry, None)
+                        if interval and tracked:
+                            kept_ranges.append(interval)
+                target.write(line)
+                ends_with_newline = line.endswith("\n")
+
+            kept_index = IntervalIndex(kept_ranges)
+            for entry in pending:
+                interval = parse_entry(entry) if kept_ranges else None
+                if interval and kept_index.covers(interval):
+                    continue
+                target.write(("" if ends_with_newline else "\n") + entry)
+                ends_with_newline = False
+                counts["added"] += 1
+            target.flush()
+            os.fsync(target.fileno())
+        os.chmod(temp_path, os.stat(allow_list_file).st_mode & 0o7777)
+        os.replace(temp_path, allow_list_file)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return counts
+
+
+@profiled()
+def update_allow_list(allow_list_file: str, remove_list_file: str, add_list_file: Optional[str] = None) -> None:
     """
     Reads the allow list file, removes IPs found in the remove list, and updates the allow list file.
-    
+
     :param allow_list_file: Path to the file containing the allow list.
-    :param remove_list_file: Path to the file containing the list of IPs to remove.
+    :param remove_list_file: Path to the file containing the list of IPs (or CIDR blocks) to remove.
+    :param add_list_file: Optional path to a file containing IPs (or CIDR blocks) to add.
     """
-    # Read the allow list file
-    with open(allow_list_file, "r") as file:
-        ip_addresses: List[str] = file.read().split("\n")
-    
-    # Read the remove list file
-    with open(remove_list_file, "r") as file:
-        remove_list: List[str] = file.read().split("\n")
-    
-    # Remove IPs found in the remove list
-    for ip in remove_list:
-        if ip in ip_addresses:
-            ip_addresses.remove(ip)
-    
-    # Write the updated allow list back to the file
-    with open(allow_list_file, "w") as file:
-        file.write("\n".join(ip_addresses))
-    
-    print("Update complete: Removed specified IPs from the allow list.")
-
-# Define file paths
-import_file = "allow_list.txt"
-remove_file = "remove_list.txt"
-
-# Execute function
-update_allow_list(import_file, remove_file)
\ No newline at end of file
+    remove_list = _read_entries(remove_list_file)
+    add_list = _read_entries(add_list_file) if add_list_file else []
+    counts = apply_allow_list_changes(allow_list_file, remove_list, add_list)
+    count("update_allow_list.removed", counts["removed"])
+    count("update_allow_list.added", counts["added"])
+    print(f"Update complete: Removed {counts['removed']} and added {counts['added']} entries in the allow list.")
+
+
+if __name__ == "__main__":
+    # Define file paths
+    import_file = "allow_list.txt"
+    remove_file = "remove_list.txt"
+
+    # Execute function
+    update_allow_list(import_file, remove_file)
@@ -0,0 +1,475 @@
+import re
+import heapq
+import math
+import socket
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from ipaddress import ip_network
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from regular_expression import IP_PATTERN, _iter_blocks
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # NumPy is optional: packed buffers stay array.array and aggregation uses dicts
+
+# Candidate IPv6 text (hex groups and colons, optionally ending in an IPv4 part); candidates
+# are validated by inet_pton, which also rejects look-alikes such as "12:30:45" timestamps.
+# A trailing "." is sentence punctuation unless a hex digit or ":" follows it.
+IPV6_CANDIDATE_PATTERN = re.compile(
+    r'(?<![\w:.])(?=[0-9A-Fa-f:]*:[0-9A-Fa-f]*:)[0-9A-Fa-f:]{2,39}(?:(?<=:)(?:\d{1,3}\.){3}\d{1,3})?'
+    r'(?![\w:]|\.[0-9A-Fa-f:])'
+)
+# A dotted quad right after a colon may be the tail of an IPv6 address such as ::ffff:10.0.0.1
+EMBEDDED_IPV4_HINT = re.compile(r':(?:\d{1,3}\.){3}\d{1,3}')
+MASK_64 = (1 << 64) - 1
+MAX_ADDRESS = {4: (1 << 32) - 1, 6: (1 << 128) - 1}  # Largest packed address of each IP version
+
+
+def ipv4_to_int(address: str) -> int:
+    """
+    Pack a dotted IPv4 address into an unsigned 32-bit integer.
+
+    :param address: The IPv4 address string.
+    :return: The packed address.
+    :raises ValueError: If the string is not a dotted-quad IPv4 address.
+    """
+    try:
+        # inet_pton, unlike inet_aton, rejects shorthand forms such as "10.1"
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, address), "big")
+    except OSError:
+        raise ValueError(f"{address!r} is not a valid IPv4 address") from None
+
+
+def ipv6_to_int(address: str) -> Optional[int]:
+    """
+    Pack an IPv6 address into an unsigned 128-bit integer.
+
+    :param address: The IPv6 address string.
+    :return: The packed address, or None if the string is not a valid IPv6 address.
+    """
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET6, address), "big")
+    except OSError:
+        return None
+
+
+def int_to_ip(value: int, version: int = 4) -> str:
+    """
+    Format a packed address back into text.
+
+    :param value: The packed address.
+    :param version: 4 or 6, since small IPv6 integers are also valid IPv4 integers.
+    :return: The address string.
+    """
+    if version == 4:
+        return socket.inet_ntoa(value.to_bytes(4, "big"))
+    return socket.inet_ntop(socket.AF_INET6, value.to_bytes(16, "big"))
+
+
+def _find_ipv4(text: str) -> List[str]:
+    """
+    Find the IPv4 addresses of a text, leaving out the dotted quads of IPv6 addresses.
+
+    :param text: The text to search.
+    :return: The IPv4 address strings, in order.
+    """
+    if not EMBEDDED_IPV4_HINT.search(text):
+        return IP_PATTERN.findall(text)
+    # Such a quad always ends where its IPv6 address ends
+    embedded = {match.end() for match in IPV6_CANDIDATE_PATTERN.finditer(text)
+                if "." in match.group() and ipv6_to_int(match.group()) is not None}
+    return [match.group() for match in IP_PATTERN.finditer(text) if match.end() not in embedded]
+
+
+def extract_valid_ip_addresses(log_data: str, ipv6: bool = True) -> List[str]:
+    """
+    Extract the valid IPv4 (and IPv6) addresses from a log string.
+
+    :param log_data: A string containing log data.
+    :param ipv6: Also extract IPv6 addresses, after the IPv4 ones.
+    :return: A list of the extracted addresses.
+    """
+    addresses = _find_ipv4(log_data)
+    if ipv6:
+        addresses.extend(candidate for candidate in IPV6_CANDIDATE_PATTERN.findall(log_data)
+                         if ipv6_to_int(candidate) is not None)
+    return addresses
+
+
+def iter_packed_ipv4(lines: Iterable[str]) -> Iterator[int]:
+    """
+    Lazily extract valid IPv4 addresses from lines of text as packed integers.
+
+    :param lines: Iterable of lines, such as an open log file.
+    :return: An iterator over the packed addresses, in order.
+    """
+    for block in _iter_blocks(lines):
+        addresses = _find_ipv4(block)
+        # Logs repeat the same addresses, so each block converts every distinct string once
+        packed = {address: ipv4_to_int(address) for address in set(addresses)}
+        yield from map(packed.__getitem__, addresses)
+
+
+def iter_packed_ipv6(lines: Iterable[str]) -> Iterator[int]:
+    """
+    Lazily extract valid IPv6 addresses from lines of text as packed integers.
+
+    :param lines: Iterable of lines, such as an open log file.
+    :return: An iterator over the packed addresses, in order.
+    """
+    for block in _iter_blocks(lines):
+        for candidate in IPV6_CANDIDATE_PATTERN.findall(block):
+            value = ipv6_to_int(candidate)
+            if value is not None:
+                yield value
+
+
+class PackedAddresses(NamedTuple):
+    """Extracted addresses in flat buffers: IPv4 as uint32, IPv6 as 16 big-endian bytes each."""
+    ipv4: array
+    ipv6: bytearray
+
+    def ipv4_values(self):
+        """The IPv4 addresses as a NumPy uint32 array (zero-copy), or the array('I') without NumPy."""
+        return np.frombuffer(self.ipv4, dtype=np.uint32) if np is not None else self.ipv4
+
+    def ipv6_values(self) -> List[int]:
+        """The IPv6 addresses as 128-bit integers."""
+        data = bytes(self.ipv6)
+        return [int.from_bytes(data[offset:offset + 16], "big") for offset in range(0, len(data), 16)]
+
+
+def pack_addresses(lines: Iterable[str], ipv6: bool = True) -> PackedAddresses:
+    """
+    Extract every valid address from lines of text into packed buffers in a single pass.
+
+    :param lines: Iterable of lines, such as an open log file.
+    :param ipv6: Also extract IPv6 addresses.
+    :return: The packed IPv4 and IPv6 addresses, each in order of appearance.
+    """
+    ipv4, ipv6_bytes = array("I"), bytearray()
+    for block in _iter_blocks(lines):
+        ipv4.extend(iter_packed_ipv4((block,)))
+        if ipv6:
+            for value in iter_packed_ipv6((block,)):
+                ipv6_bytes += value.to_bytes(16, "big")
+    return PackedAddresses(ipv4, ipv6_bytes)
+
+
+def top_addresses(packed, k: int = 10) -> List[Tuple[int, int]]:
+    """
+    Exactly rank the most frequent addresses of a packed buffer.
+
+    :param packed: Packed addresses (array('I'), NumPy array or any iterable of ints).
+    :param k: Number of addresses to return.
+    :return: A list of (packed address, count), most frequent first.
+    """
+    if np is not None and isinstance(packed, (array, np.ndarray)) and len(packed):
+        values, counts = np.unique(np.asarray(packed), return_counts=True)
+        best = np.argsort(counts, kind="stable")[::-1][:k]
+        return [(int(values[index]), int(counts[index])) for index in best]
+    return Counter(packed).most_common(k)
+
+
+def distinct_count(packed) -> int:
+    """
+    Exactly count the distinct addresses of a packed buffer.
+
+    :param packed: Packed addresses (array('I'), NumPy array or any iterable of ints).
+    :return: The number of distinct addresses.
+    """
+    if np is not None and isinstance(packed, (array, np.ndarray)):
+        return int(np.unique(np.asarray(packed)).size)
+    return len(set(packed))
+
+
+class SpaceSaving:
+    """
+    Streaming top-K in bounded memory (Metwally et al.'s Space-Saving algorithm).
+
+    At most `capacity` items are monitored. A new item replaces the least frequent one and
+    inherits its count, so counts are over-estimated by at most `error(item)`; every item
+    more frequent than total / capacity is guaranteed to be monitored.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        :param capacity: Number of monitored items, usually a few times the wanted K.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[int, int] = {}
+        self._errors: Dict[int, int] = {}
+        # Min-heap with one (count, item) entry per monitored item; entries go stale when the
+        # item is incremented and are refreshed lazily, only when they reach the top
+        self._heap: List[Tuple[int, int]] = []
+
+    def add(self, item: int, count: int = 1) -> None:
+        """
+        Count occurrences of an item.
+
+        :param item: The item, e.g. a packed address.
+        :param count: Number of occurrences.
+        """
+        self.total += count
+        counts = self._counts
+        if item in counts:
+            counts[item] += count
+            return
+        if len(counts) < self.capacity:
+            counts[item], self._errors[item] = count, 0
+            heapq.heappush(self._heap, (count, item))
+            return
+        heap = self._heap
+        while True:
+            smallest, victim = heap[0]
+            current = counts[victim]
+            if current == smallest:
+                break
+            heapq.heapreplace(heap, (current, victim))
+        del counts[victim], self._errors[victim]
+        counts[item], self._errors[item] = smallest + count, smallest
+        heapq.heapreplace(heap, (smallest + count, item))
+
+    def update(self, items: Iterable[int]) -> None:
+        """
+        Count every item of an iterable.
+
+        :param items: Iterable of items.
+        """
+        for item, count in Counter(items).items():
+            self.add(item, count)
+
+    def error(self, item: int) -> int:
+        """Maximum over-estimation of an item's count."""
+        return self._errors.get(item, 0)
+
+    def top(self, k: int = 10) -> List[Tuple[int, int]]:
+        """
+        Return the most frequent items seen so far.
+
+        :param k: Number of items to return.
+        :return: A list of (item, estimated count), most frequent first.
+        """
+        return heapq.nlargest(k, self._counts.items(), key=lambda pair: pair[1])
+
+
+def _mix64(value: int) -> int:
+    """SplitMix64 finalizer: spreads the bits of an integer over a 64-bit hash."""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+class HyperLogLog:
+    """
+    Approximate distinct counting in fixed memory: 2**precision one-byte registers,
+    with a standard error of about 1.04 / sqrt(2**precision) (0.8% at the default 14).
+    """
+
+    def __init__(self, precision: int = 14):
+        """
+        :param precision: Number of index bits, between 4 and 18.
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("Precision must be between 4 and 18.")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+
+    def add(self, item: int) -> None:
+        """
+        Add an item, e.g. a packed address (128-bit IPv6 values are folded to 64 bits first).
+
+        :param item: The non-negative integer to count.
+        """
+        hashed = _mix64((item ^ (item >> 64)) & MASK_64)
+        rest_bits = 64 - self.precision
+        index, rest = hashed >> rest_bits, hashed & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, items) -> None:
+        """
+        Add many items, vectorized when NumPy is installed and `items` is an array.
+
+        :param items: Packed addresses (array('I'), NumPy array or any iterable of ints).
+        """
+        if np is not None and isinstance(items, (array, np.ndarray)):
+            values = np.asarray(items).astype(np.uint64)
+            with np.errstate(over="ignore"):
+                values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+                values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+                values ^= values >> np.uint64(31)
+            rest_bits = 64 - self.precision
+            indices = (values >> np.uint64(rest_bits)).astype(np.int64)
+            rest = values & np.uint64((1 << rest_bits) - 1)
+            # frexp's exponent is the bit length (0 for 0); float rounding can only be off for
+            # values within 2**-53 of a power of two, which is too rare to skew the estimate
+            _, lengths = np.frexp(rest.astype(np.float64))
+            ranks = (rest_bits - lengths + 1).astype(np.uint8)
+            registers = np.frombuffer(self.registers, dtype=np.uint8)
+            np.maximum.at(registers, indices, ranks)
+            return
+        add = self.add
+        for item in items:
+            add(item)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """
+        Fold another sketch of the same precision into this one (union of the streams).
+
+        :param other: The sketch to merge.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches of different precision.")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        """
+        Estimate the number of distinct items added.
+
+        :return: The estimated distinct count.
+        """
+        size = self.size
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -rank for rank in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            return round(size * math.log(size / zeros))  # Linear counting for small cardinalities
+        return round(estimate)
+
+
+def aggregate_addresses(lines: Iterable[str], k: int = 10, approximate: bool = False,
+                        capacity: int = 10_000, precision: int = 14) -> Dict[str, object]:
+    """
+    Stream lines of text once and summarize the valid IPv4 addresses they mention.
+
+    :param lines: Iterable of lines, such as an open log file.
+    :param k: Number of top addresses to report.
+    :param approximate: Use SpaceSaving and HyperLogLog (bounded memory) instead of exact counts.
+    :param capacity: Items monitored by SpaceSaving in approximate mode.
+    :param precision: HyperLogLog precision in approximate mode.
+    :return: A dictionary with "total", "distinct" and "top" (list of (address, count)).
+    """
+    if approximate:
+        top, sketch = SpaceSaving(capacity), HyperLogLog(precision)
+        for block in _iter_blocks(lines):
+            packed = array("I", iter_packed_ipv4((block,)))
+            top.update(packed)
+            sketch.update(packed)
+        ranked, total, distinct = top.top(k), top.total, sketch.count()
+    else:
+        counts: Counter = Counter()
+        for block in _iter_blocks(lines):
+            counts.update(iter_packed_ipv4((block,)))
+        ranked, total, distinct = counts.most_common(k), sum(counts.values()), len(counts)
+    return {
+        "total": total,
+        "distinct": distinct,
+        "top": [(int_to_ip(address), count) for address, count in ranked],
+    }
+
+
+class CidrBlocklist:
+    """
+    Membership index over many CIDR blocks: the blocks are merged into disjoint sorted
+    [start, end] intervals, so a lookup is one binary search whatever the list size.
+    """
+
+    def __init__(self, networks: Iterable[str]):
+        """
+        :param networks: CIDR blocks or single addresses, IPv4 and/or IPv6 (e.g. "10.0.0.0/8").
+        """
+        intervals: Dict[int, List[Tuple[int, int]]] = {4: [], 6: []}
+        for network in networks:
+            parsed = ip_network(network.strip(), strict=False)
+            intervals[parsed.version].append((int(parsed.network_address), int(parsed.broadcast_address)))
+        self._starts: Dict[int, List[int]] = {}
+        self._ends: Dict[int, List[int]] = {}
+        for version, ranges in intervals.items():
+            merged: List[List[int]] = []
+            for start, end in sorted(ranges):
+                if merged and start <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            self._starts[version] = [start for start, _ in merged]
+            self._ends[version] = [end for _, end in merged]
+        self._ipv4_starts = array("I", self._starts[4])
+        self._ipv4_ends = array("I", self._ends[4])
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "CidrBlocklist":
+        """
+        Load a blocklist with one CIDR block per line; blank lines and '#' comments are skipped.
+
+        :param file_path: Path to the blocklist file.
+        :return: The blocklist index.
+        """
+        with open(file_path, "r") as file:
+            return cls(line.split("#", 1)[0] for line in file if line.split("#", 1)[0].strip())
+
+    def __len__(self) -> int:
+        """Number of disjoint intervals after merging."""
+        return len(self._starts[4]) + len(self._starts[6])
+
+    def contains(self, address: Union[int, str], version: int = 4) -> bool:
+        """
+        Test whether an address falls in any blocked network.
+
+        :param address: Address string, or packed integer of the given version.
+        :param version: IP version of a packed integer (ignored for strings).
+        :return: True if the address is blocked.
+        :raises ValueError: If the address is not a valid IPv4/IPv6 address of that version.
+        """
+        if isinstance(address, str):
+            version = 6 if ":" in address else 4
+            try:
+                # inet_pton, unlike inet_aton, rejects shorthand forms such as "10.1"
+                packed = socket.inet_pton(socket.AF_INET6 if version == 6 else socket.AF_INET, address)
+            except OSError:
+                raise ValueError(f"{address!r} is not a valid IP address") from None
+            address = int.from_bytes(packed, "big")
+        elif version not in MAX_ADDRESS:
+            raise ValueError(f"Unknown IP version {version!r}")
+        elif not isinstance(address, int) or not 0 <= address <= MAX_ADDRESS[version]:
+            raise ValueError(f"{address!r} is not a packed IPv{version} address")
+        starts = self._starts[version]
+        position = bisect_right(starts, address) - 1
+        return position >= 0 and address <= self._ends[version][position]
+
+    def __contains__(self, address: Union[int, str]) -> bool:
+        return self.contains(address)
+
+    def contains_many(self, packed):
+        """
+        Test many packed IPv4 addresses at once.
+
+        :param packed: Packed IPv4 addresses (array('I'), NumPy array or any iterable of ints).
+        :return: NumPy bool array, or a list of booleans without NumPy.
+        """
+        if np is not None:
+            values = np.asarray(packed, dtype=np.uint32)
+            starts = np.frombuffer(self._ipv4_starts, dtype=np.uint32)
+            ends = np.frombuffer(self._ipv4_ends, dtype=np.uint32)
+            if not len(starts):
+                return np.zeros(len(values), dtype=bool)
+            positions = np.searchsorted(starts, values, side="right") - 1
+            return (positions >= 0) & (values <= ends[np.maximum(positions, 0)])
+        return [self.contains(address) for address in packed]
+
+
+# Example usage:
+if __name__ == "__main__":
+    log = ["Failed login from 192.168.1.1 on port 22", "Failed login from 999.1.1.1 via 2001:db8::7",
+           "Failed login from 192.168.1.1 on port 22"]
+    print(extract_valid_ip_addresses(" ".join(log)))  # ['192.168.1.1', '192.168.1.1', '2001:db8::7']
+    print(aggregate_addresses(log, k=1))  # {'total': 2, 'distinct': 1, 'top': [('192.168.1.1', 2)]}
+    print("192.168.1.1" in CidrBlocklist(["192.168.0.0/16"]))  # True
@@ -1,5 +1,37 @@
+import os
 import re
-from typing import List, Tuple
+import time
+import random
+import tempfile
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Compiled once at import: re.* with a pattern string pays a cache lookup on every call
+# and recompiles once other code has pushed the pattern out of re's small cache.
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+# Octets are validated in the pattern itself: 0-255, without leading zeros
+IPV4_OCTET = r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+IPV4 = rf'(?:{IPV4_OCTET}\.){{3}}{IPV4_OCTET}'
+IP_PATTERN = re.compile(rf'\b{IPV4}\b')
+SQL_INJECTION_PATTERN = re.compile(r"('|--|#|;|\/\*|\*\/|xp_)", re.IGNORECASE)
+URL_PATTERN = re.compile(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+')
+CARD_PATTERN = re.compile(r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b')
+STRONG_PASSWORD_PATTERN = re.compile(r'^(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{8,}$')
+CARD_MASK = '****-****-****-****'
+
+# One alternation finds every indicator kind in a single pass. Every kind starts at a word
+# boundary, which is tested once per position, and the digit-led kinds are only attempted
+# where a digit follows. An IP inside a URL is reported as part of the URL only.
+INDICATOR_PATTERN = re.compile(
+    r'\b(?:'
+    r'(?P<url>https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+)'
+    r'|(?P<email>[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]*[a-zA-Z0-9])'
+    r'|(?=\d)(?:(?P<card>\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b)|(?P<ip>' + IPV4 + r'\b))'
+    r')'
+)
+INDICATOR_KINDS = ("url", "email", "card", "ip")
+BLOCK_LINES = 10_000
 
 
 def is_valid_email(email: str) -> bool:
@@ -9,19 +41,17 @@ def is_valid_email(email: str) -> bool:
     :param email: The email address to validate.
     :return: True if the email is valid, False otherwise.
     """
-    pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-    return bool(re.match(pattern, email))
+    return EMAIL_PATTERN.match(email) is not None
 
 
 def extract_ip_addresses(log_data: str) -> List[str]:
     """
-    Extract all IPv4 addresses from a given log string.
+    Extract all valid IPv4 addresses from a given log string.
     
     :param log_data: A string containing log data.
     :return: A list of extracted IP addresses.
     """
-    pattern = r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'
-    return re.findall(pattern, log_data)
+    return IP_PATTERN.findall(log_data)
 
 
 def detect_sql_injection(query: str) -> bool:
@@ -31,8 +61,7 @@ def detect_sql_injection(query: str) -> bool:
     :param query: The SQL query string to analyze.
     :return: True if an SQL injection pattern is detected, False otherwise.
     """
-    pattern = r"('|--|#|;|\/\*|\*\/|xp_)"
-    return bool(re.search(pattern, query, re.IGNORECASE))
+    return SQL_INJECTION_PATTERN.search(query) is not None
 
 
 def extract_urls(text: str) -> List[str]:
@@ -42,8 +71,7 @@ def extract_urls(text: str) -> List[str]:
     :param text: The input text containing potential URLs.
     :return: A list of extracted URLs.
     """
-    pattern = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+'
-    return re.findall(pattern, text)
+    return URL_PATTERN.findall(text)
 
 
 def mask_sensitive_data(text: str) -> str:
@@ -53,8 +81,7 @@ def mask_sensitive_data(text: str) -> str:
     :param text: The input text containing potential sensitive data.
     :return: The text with sensitive data masked.
     """
-    pattern = r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b'
-    return re.sub(pattern, '****-****-****-****', text)
+    return CARD_PATTERN.sub(CARD_MASK, text)
 
 
 def analyze_password_strength(password: str) -> Tuple[bool, str]:
@@ -64,11 +91,173 @@ def analyze_password_strength(password: str) -> Tuple[bool, str]:
     :param password: The password string to check.
     :return: A tuple containing a boolean (True if strong, False otherwise) and a message.
     """
-    pattern = r'^(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{8,}$'
-    if re.match(pattern, password):
+    if STRONG_PASSWORD_PATTERN.match(password):
         return True, "Password is strong."
     return False, "Password must be at least 8 characters long, include an uppercase letter, a lowercase letter, a number, and a special character."
 
+
+def _iter_blocks(lines: Iterable[str], block_lines: int = BLOCK_LINES) -> Iterator[str]:
+    """
+    Joins lines into large newline-terminated blocks so a pattern scans many lines per call.
+    
+    :param lines: Iterable of lines, with or without trailing newlines (e.g. a file object).
+    :param block_lines: Number of lines per block.
+    :return: Iterator over blocks holding exactly one newline per line.
+    """
+    iterator = iter(lines)
+    while True:
+        block = list(islice(iterator, block_lines))
+        if not block:
+            return
+        text = "".join(block) if block[0].endswith("\n") else "\n".join(block)
+        yield text if text.endswith("\n") else text + "\n"
+
+
+def validate_emails(emails: Iterable[str]) -> List[bool]:
+    """
+    Validate many email addresses.
+    
+    :param emails: Iterable of email addresses.
+    :return: A list of booleans, True where the email is valid.
+    """
+    match = EMAIL_PATTERN.match
+    return [match(email) is not None for email in emails]
+
+
+def detect_sql_injections(queries: Iterable[str]) -> List[bool]:
+    """
+    Detect potential SQL injection patterns in many SQL queries.
+    
+    :param queries: Iterable of SQL query strings.
+    :return: A list of booleans, True where an SQL injection pattern is detected.
+    """
+    search = SQL_INJECTION_PATTERN.search
+    return [search(query) is not None for query in queries]
+
+
+def iter_ip_addresses(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily extract IPv4 addresses from lines of text, scanning them in large blocks.
+    
+    :param lines: Iterable of lines, such as an open log file.
+    :return: An iterator over the extracted IP addresses, in order.
+    """
+    for block in _iter_blocks(lines):
+        yield from IP_PATTERN.findall(block)
+
+
+def iter_urls(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily extract URLs from lines of text, scanning them in large blocks.
+    
+    :param lines: Iterable of lines, such as an open file.
+    :return: An iterator over the extracted URLs, in order.
+    """
+    for block in _iter_blocks(lines):
+        yield from URL_PATTERN.findall(block)
+
+
+def iter_masked_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily mask credit card numbers in lines of text.
+    
+    :param lines: Iterable of lines, such as an open file.
+    :return: An iterator over the masked lines, newlines preserved.
+    """
+    sub = CARD_PATTERN.sub
+    for line in lines:
+        yield sub(CARD_MASK, line)
+
+
+def iter_indicators(lines: Iterable[str]) -> Iterator[Tuple[int, str, str]]:
+    """
+    Extract IPs, URLs, emails and card numbers from lines of text in a single scan.
+    
+    :param lines: Iterable of lines, such as an open log file.
+    :return: An iterator over (line number starting at 1, kind, value) tuples, where kind is
+             one of INDICATOR_KINDS.
+    """
+    line_number = 1
+    for block in _iter_blocks(lines):
+        count, position = block.count, 0
+        for match in INDICATOR_PATTERN.finditer(block):
+            start = match.start()
+            line_number += count("\n", position, start)
+            position = start
+            yield line_number, match.lastgroup, match.group()
+        line_number += count("\n", position)
+
+
+def extract_indicators(text: str) -> Dict[str, List[str]]:
+    """
+    Extract IPs, URLs, emails and card numbers from a text in a single scan.
+    
+    :param text: The input text.
+    :return: A dictionary of kind -> list of extracted values.
+    """
+    indicators: Dict[str, List[str]] = {kind: [] for kind in INDICATOR_KINDS}
+    for match in INDICATOR_PATTERN.finditer(text):
+        indicators[match.lastgroup].append(match.group())
+    return indicators
+
+
+def _write_corpus(file_path: str, size_mb: int) -> None:
+    """Writes a synthetic log corpus of roughly size_mb megabytes with scattered indicators."""
+    templates = [
+        "INFO request served in {n} ms for session {n}",
+        "WARN failed login from {ip} on port 22",
+        "INFO user {n} visited https://example{n}.com/path?id={n}",
+        "INFO mail queued for user{n}@example.com",
+        "DEBUG payment with card 4111-1111-1111-{n4} accepted",
+        "INFO cache hit ratio {n} percent",
+    ]
+    generator = random.Random(0)
+    written, target = 0, size_mb * 1024 * 1024
+    with open(file_path, "w") as file:
+        while written < target:
+            lines = []
+            for _ in range(10_000):
+                template = generator.choice(templates)
+                lines.append(template.format(
+                    n=generator.randrange(100000), n4=f"{generator.randrange(10000):04}",
+                    ip=".".join(str(generator.randrange(256)) for _ in range(4))))
+            chunk = "\n".join(lines) + "\n"
+            file.write(chunk)
+            written += len(chunk)
+
+
+def benchmark_extraction(size_mb: int = 100, file_path: Optional[str] = None) -> Dict[str, float]:
+    """
+    Compare per-line calls of the single-string functions with the single-scan extractor.
+    
+    :param size_mb: Size of the synthetic corpus generated when no file is given.
+    :param file_path: Existing corpus to scan instead (e.g. a multi-GB log).
+    :return: A dictionary of approach -> megabytes per second.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        if file_path is None:
+            file_path = os.path.join(directory, "corpus.log")
+            _write_corpus(file_path, size_mb)
+        megabytes = os.path.getsize(file_path) / (1024 * 1024)
+        results = {}
+
+        start = time.perf_counter()
+        with open(file_path, "r") as file:
+            for line in file:
+                extract_ip_addresses(line)
+                extract_urls(line)
+                for word in line.split():
+                    is_valid_email(word)
+                mask_sensitive_data(line)
+        results["per-line functions"] = megabytes / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with open(file_path, "r") as file:
+            for _ in iter_indicators(file):
+                pass
+        results["iter_indicators"] = megabytes / (time.perf_counter() - start)
+    return results
+
 # Example usage:
 if __name__ == "__main__":
     print(is_valid_email("test@example.com"))  # True
@@ -77,3 +266,5 @@ if __name__ == "__main__":
     print(extract_urls("Visit https://example.com for more details."))  # ['https://example.com']
     print(mask_sensitive_data("My credit card number is 1234-5678-9101-1121."))  # 'My credit card number is ****-****-****-****.'
     print(analyze_password_strength("StrongPass1!"))  # (True, 'Password is strong.')
+    print(extract_indicators("Login from 10.0.0.5 by bob@example.com, see https://example.com"))
+    # print(benchmark_extraction())